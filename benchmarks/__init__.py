@@ -0,0 +1 @@
+"""Benchmarks for the 4heat integration."""
@@ -0,0 +1,71 @@
+"""Measure command latency while the device is busy with routine polls.
+
+The local simulator answers every frame after a fixed delay. Several
+pollers keep sending "info" while "turn_on" commands are issued, and the
+p50/p99 latency of both command types is reported.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_command_latency
+"""
+from __future__ import annotations
+
+import asyncio
+from statistics import quantiles
+import time
+
+from homeassistant.const import SERVICE_TURN_ON
+
+from custom_components.fourheat.connection import set_host_limits
+from custom_components.fourheat.fourheat import FourHeatDevice
+
+from .simulator import FourHeatSimulator
+
+DEVICE_DELAY = 0.02  # Seconds the stand-in device needs per frame
+POLLERS = 4
+COMMANDS = 100
+
+
+def percentiles(samples: list[float]) -> str:
+    """Format p50 and p99 in milliseconds."""
+    cuts = quantiles(samples, n=100)
+    return f"p50 {cuts[49] * 1000:7.1f} ms  p99 {cuts[98] * 1000:7.1f} ms"
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    simulator = FourHeatSimulator(latency=DEVICE_DELAY)
+    await simulator.start()
+    # measure the command queue only, not the spacing of the host
+    set_host_limits(simulator.host, concurrency=1, spacing=0)
+    device = await FourHeatDevice.create("bench", simulator.host, simulator.port)
+    info_latency: list[float] = []
+    on_latency: list[float] = []
+
+    async def timed(command: str, samples: list[float]) -> None:
+        start = time.monotonic()
+        await device.async_send_command(command)
+        samples.append(time.monotonic() - start)
+
+    async def poller() -> None:
+        while True:
+            await timed("info", info_latency)
+
+    pollers = [asyncio.create_task(poller()) for _ in range(POLLERS)]
+    for _ in range(COMMANDS):
+        await timed(SERVICE_TURN_ON, on_latency)
+        await asyncio.sleep(DEVICE_DELAY * 2)
+    for task in pollers:
+        task.cancel()
+    await asyncio.gather(*pollers, return_exceptions=True)
+    await device.async_shutdown()
+    await asyncio.sleep(DEVICE_DELAY * 2)  # let the last handler finish
+    await simulator.stop()
+
+    print(f"device delay {DEVICE_DELAY * 1000:.0f} ms, {POLLERS} concurrent pollers")
+    print(f"turn_on  ({len(on_latency):4d}): {percentiles(on_latency)}")
+    print(f"info     ({len(info_latency):4d}): {percentiles(info_latency)}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
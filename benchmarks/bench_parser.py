@@ -0,0 +1,83 @@
+"""Compare the wire protocol parser with the former ast.literal_eval path.
+
+Every reply is parsed from scratch, nothing is shared between polls.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_parser
+"""
+from __future__ import annotations
+
+from ast import literal_eval
+import timeit
+
+from custom_components.fourheat.protocol import parse_frame
+
+# Replies as received from a boiler stove, a small air stove and a read-back
+REPLIES = {
+    "SEL 44": (
+        b'["SEL","44","J30001000000000005","J30002000000000000",'
+        b'"J30003000000000000","J30004000000000000","J30005000000000142",'
+        b'"J30006000000000021","J30007000000000003","J30008000000001450",'
+        b'"J30009000000000000","J30010000000000000","J30011000000000003",'
+        b'"J30012000000000062","J30015000000000055","J30017000000000067",'
+        b'"J30020000000001320","J30025000000001448","J30026000000000038",'
+        b'"J30033000000000085","J30040000000000000","J30044000000000000",'
+        b'"J30084000000000000","J40007000000000000","J40016000000000012",'
+        b'"J50001000000000001","B20180000000000070","B20199000000000065",'
+        b'"B20005000000000050","B20006000000000080","B20211000000000005",'
+        b'"B20225000000000000","B20364000000000003","B20365000000000000",'
+        b'"B20366000000000000","B20369000000000000","B20374000000000000",'
+        b'"B20375000000000000","B20381000000000000","B20493000000000021",'
+        b'"B20570000000000000","B20575000000000000","B20801000000000003",'
+        b'"B20803000000000000","B20813000000000003","B21700000000000020"]'
+    ),
+    "SEL 12": (
+        b'["SEL","12","J30001000000000000","J30002000000000000",'
+        b'"J30003000000000000","J30005000000000021","J30006000000000019",'
+        b'"J30008000000000000","J30011000000000000","J30017000000000024",'
+        b'"B20180000000000065","B20364000000000002","B20493000000000021",'
+        b'"B21700000000000020"]'
+    ),
+    "SEC 3": b'["SEC","3","I30001000000000005","I30002000000000000","I30017000000000067"]',
+}
+
+
+def literal_eval_parse(frame: bytes) -> tuple[str, list[dict]]:
+    """Parse a frame the way the integration did before protocol.py."""
+    result = literal_eval(frame.decode())
+    sensors = []
+    for sensor in result[2:]:
+        if len(sensor) > 6:
+            sensors.append(
+                {
+                    "id": sensor[1:6],
+                    "sensor_type": sensor[0],
+                    "value": int(sensor[7:]),
+                }
+            )
+    return (result[0], sensors)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    print(f"{'reply':<8} {'literal_eval us':>16} {'parser us':>10} {'speedup':>8}")
+    for name, frame in REPLIES.items():
+        expected = literal_eval_parse(frame)
+        (result, records) = parse_frame(frame)
+        assert result == expected[0]
+        assert [record._asdict() for record in records] == expected[1]
+
+        number = 2000
+        timings = [
+            min(timeit.repeat(lambda: func(frame), number=number)) / number * 1e6
+            for func in (literal_eval_parse, parse_frame)
+        ]
+        print(
+            f"{name:<8} {timings[0]:>16.1f} {timings[1]:>10.1f}"
+            f" {timings[0] / timings[1]:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
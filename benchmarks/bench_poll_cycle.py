@@ -0,0 +1,211 @@
+"""Measure the polling hot path of 1, 10 and 100 stoves.
+
+Every stove is a FourHeatCoordinator with its own FourHeatDevice, all of
+them polling the local simulator. A cycle updates all stoves concurrently
+through FourHeatCoordinator._async_update_data, either with a full SEL
+sweep or with the tiered reads of the due sensors. Reported per fleet size
+and mode are cycle latency, CPU time and allocated memory per stove update
+and the event loop stall seen by a 1 ms ticker. CPU time and allocations
+are measured in passes of their own, so neither the ticker nor tracemalloc
+is charged to the updates.
+
+The results are printed (or written with --output) as JSON. Run from the
+repository root:
+
+    python -m benchmarks.bench_poll_cycle --stoves 1 10 100
+"""
+# pylint: disable=protected-access
+from __future__ import annotations
+
+import argparse
+import asyncio
+from contextlib import suppress
+import json
+from statistics import mean, quantiles
+import time
+import tracemalloc
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT
+from homeassistant.core import HomeAssistant
+
+from custom_components.fourheat.connection import set_host_limits
+from custom_components.fourheat.const import DOMAIN
+from custom_components.fourheat.coordinator import FourHeatCoordinator
+from custom_components.fourheat.fourheat import FourHeatDevice
+
+from .simulator import FourHeatSimulator
+
+DEVICE_DELAY = 0.005  # Seconds the simulator needs per frame
+CYCLES = 20
+TICK = 0.001  # Seconds between event loop stall probes
+
+
+def milliseconds(samples: list[float]) -> dict[str, float]:
+    """Summarize samples in seconds as milliseconds."""
+    cuts = (
+        quantiles(samples, n=100, method="inclusive")
+        if len(samples) > 1
+        else samples * 99
+    )
+    return {
+        "mean": round(mean(samples) * 1000, 3),
+        "p50": round(cuts[49] * 1000, 3),
+        "p99": round(cuts[98] * 1000, 3),
+        "max": round(max(samples) * 1000, 3),
+    }
+
+
+class StallProbe:
+    """Measure how late the event loop wakes up a periodic ticker."""
+
+    def __init__(self) -> None:
+        """Initialize the probe."""
+        self.lags: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    async def _tick(self) -> None:
+        while True:
+            expected = time.perf_counter() + TICK
+            await asyncio.sleep(TICK)
+            self.lags.append(max(0.0, time.perf_counter() - expected))
+
+    def start(self) -> None:
+        """Start probing."""
+        self.lags = []
+        self._task = asyncio.create_task(self._tick())
+
+    async def stop(self) -> dict[str, float]:
+        """Stop probing and return the stall summary."""
+        if self._task:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+        return milliseconds(self.lags or [0.0])
+
+
+async def create_fleet(
+    hass: HomeAssistant, simulator: FourHeatSimulator, stoves: int
+) -> list[FourHeatCoordinator]:
+    """Create initialized coordinators of stoves."""
+    # every simulated stove stands for a module of its own
+    set_host_limits(simulator.host, concurrency=stoves, spacing=0)
+    coordinators = []
+    for number in range(stoves):
+        data = {
+            CONF_NAME: f"stove {number}",
+            CONF_HOST: simulator.host,
+            CONF_PORT: simulator.port,
+        }
+        entry = ConfigEntry(1, DOMAIN, data[CONF_NAME], data, "user")
+        device = await FourHeatDevice.create(
+            data[CONF_NAME], simulator.host, simulator.port
+        )
+        coordinators.append(FourHeatCoordinator(hass, entry, device))
+    return coordinators
+
+
+async def poll(coordinator: FourHeatCoordinator, sweep: bool) -> None:
+    """Update a stove, with a full SEL sweep if sweep."""
+    if sweep:
+        coordinator._last_discovery = None
+    await coordinator._async_update_data()
+
+
+async def run_cycles(
+    coordinators: list[FourHeatCoordinator], sweep: bool
+) -> dict[str, Any]:
+    """Run the poll cycles and return latency and stall summary."""
+    cycle_latency: list[float] = []
+    update_latency: list[float] = []
+
+    async def update(coordinator: FourHeatCoordinator) -> None:
+        start = time.perf_counter()
+        await poll(coordinator, sweep)
+        update_latency.append(time.perf_counter() - start)
+
+    probe = StallProbe()
+    probe.start()
+    for _ in range(CYCLES):
+        start = time.perf_counter()
+        await asyncio.gather(*(update(coordinator) for coordinator in coordinators))
+        cycle_latency.append(time.perf_counter() - start)
+    return {
+        "cycle_latency_ms": milliseconds(cycle_latency),
+        "update_latency_ms": milliseconds(update_latency),
+        "loop_stall_ms": await probe.stop(),
+    }
+
+
+async def measure_cpu(coordinators: list[FourHeatCoordinator], sweep: bool) -> float:
+    """Return CPU time per stove update in milliseconds."""
+    cpu_start = time.process_time()
+    for _ in range(CYCLES):
+        await asyncio.gather(
+            *(poll(coordinator, sweep) for coordinator in coordinators)
+        )
+    cpu = time.process_time() - cpu_start
+    return round(cpu * 1000 / (CYCLES * len(coordinators)), 3)
+
+
+async def measure_allocations(
+    coordinators: list[FourHeatCoordinator], sweep: bool
+) -> dict[str, float]:
+    """Return memory allocated per stove update in KiB."""
+    tracemalloc.start()
+    try:
+        for _ in range(CYCLES):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            await asyncio.gather(
+                *(poll(coordinator, sweep) for coordinator in coordinators)
+            )
+            current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "peak_kib_per_update": round((peak - before) / 1024 / len(coordinators), 3),
+        "retained_kib_per_update": round(
+            (current - before) / 1024 / len(coordinators), 3
+        ),
+    }
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stoves", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--output", help="write the JSON results to this file")
+    args = parser.parse_args()
+
+    hass = HomeAssistant()
+    simulator = FourHeatSimulator(latency=DEVICE_DELAY)
+    await simulator.start()
+    results: dict[str, Any] = {
+        "device_delay_ms": DEVICE_DELAY * 1000,
+        "cycles": CYCLES,
+        "fleets": {},
+    }
+    for stoves in args.stoves:
+        coordinators = await create_fleet(hass, simulator, stoves)
+        fleet: dict[str, Any] = {}
+        for mode, sweep in (("sweep", True), ("tiered", False)):
+            fleet[mode] = await run_cycles(coordinators, sweep)
+            fleet[mode]["cpu_ms_per_update"] = await measure_cpu(coordinators, sweep)
+            fleet[mode]["allocations"] = await measure_allocations(coordinators, sweep)
+        results["fleets"][str(stoves)] = fleet
+        for coordinator in coordinators:
+            await coordinator.device.async_shutdown()
+    await simulator.stop()
+
+    report = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
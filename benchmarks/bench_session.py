@@ -0,0 +1,77 @@
+"""Compare connect per request with the persistent session mode.
+
+A stove is polled through the local simulator, whose module needs some
+time to accept every new connection. Reported for connect per request, a
+persistent session with a module keeping connections open and one with a
+module closing every connection (where the device falls back) are the
+connections opened and the p50/p99 command latency.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_session
+"""
+from __future__ import annotations
+
+import asyncio
+from statistics import quantiles
+import time
+
+from custom_components.fourheat.connection import set_host_limits
+from custom_components.fourheat.fourheat import FourHeatDevice
+
+from .simulator import FourHeatSimulator
+
+CONNECT_DELAY = 0.02  # Seconds the simulated module needs to accept a connection
+DEVICE_DELAY = 0.005  # Seconds the simulated module needs per frame
+COMMANDS = 200
+
+SCENARIOS = (
+    ("connect per request", False, True),
+    ("persistent session", True, True),
+    ("session, module closes", True, False),
+)
+
+
+def percentiles(samples: list[float]) -> str:
+    """Format p50 and p99 in milliseconds."""
+    cuts = quantiles(samples, n=100)
+    return f"p50 {cuts[49] * 1000:6.1f} ms  p99 {cuts[98] * 1000:6.1f} ms"
+
+
+async def run(persistent: bool, keep_alive: bool) -> tuple[int, list[float], bool]:
+    """Poll the simulator, return connections, latencies and session state."""
+    simulator = FourHeatSimulator(
+        latency=DEVICE_DELAY, connect_delay=CONNECT_DELAY, keep_alive=keep_alive
+    )
+    await simulator.start()
+    # measure the connections only, not the spacing of the host
+    set_host_limits(simulator.host, concurrency=1, spacing=0)
+    device = await FourHeatDevice.create("bench", simulator.host, simulator.port)
+    device.persistent_session = persistent
+    latency: list[float] = []
+    for _ in range(COMMANDS):
+        start = time.perf_counter()
+        await device.async_send_command("info")
+        latency.append(time.perf_counter() - start)
+    kept = device.statistics.reused_connections > 0
+    await device.async_shutdown()
+    await simulator.stop()
+    return (simulator.connections, latency, kept)
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    print(
+        f"{COMMANDS} commands, connect delay {CONNECT_DELAY * 1000:.0f} ms, "
+        f"device delay {DEVICE_DELAY * 1000:.0f} ms"
+    )
+    for name, persistent, keep_alive in SCENARIOS:
+        connections, latency, kept = await run(persistent, keep_alive)
+        print(
+            f"{name:<24} connections {connections:4d}  {percentiles(latency)}"
+            f"  reused {'yes' if kept else 'no'}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
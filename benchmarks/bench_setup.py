@@ -0,0 +1,95 @@
+"""Compare the entity setup cost with the former per entry SENSORS walks.
+
+Setting up a config entry finds its platforms and builds the entity
+descriptions of every platform. Formerly both walked const.SENSORS anew
+for every entry (and every reload), now they use the registry built once
+per process. The cost is reported for N entries of a stove with all
+known sensors.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_setup
+"""
+from __future__ import annotations
+
+import timeit
+from types import SimpleNamespace
+
+from custom_components.fourheat.button import FourHeatButton, FourHeatButtonDescription
+from custom_components.fourheat.const import SENSORS
+from custom_components.fourheat.coordinator import FourHeatCoordinator
+from custom_components.fourheat.entity import _setup_descriptions
+from custom_components.fourheat.number import FourHeatNumber, FourHeatNumberDescription
+from custom_components.fourheat.sensor import FourHeatSensor, FourHeatSensorDescription
+from custom_components.fourheat.switch import FourHeatSwitch, FourHeatSwitchDescription
+
+ENTRIES = (1, 10, 100)
+REPEAT = 5
+
+PLATFORMS = (
+    (FourHeatSensor, FourHeatSensorDescription),
+    (FourHeatNumber, FourHeatNumberDescription),
+    (FourHeatButton, FourHeatButtonDescription),
+    (FourHeatSwitch, FourHeatSwitchDescription),
+)
+STOVE_SENSORS = {attr: {"sensor_type": "J", "value": 0} for attr in SENSORS}
+
+
+def legacy_build_platforms(sensors: dict) -> dict[str, list]:
+    """Find platforms like the former coordinator walk, without logging."""
+    platforms: dict[str, list] = {}
+    for attr in sensors:
+        for sensor in SENSORS[attr]:
+            keys = {key: value for key, value in sensor.items() if key != "platform"}
+            platforms.setdefault(str(sensor["platform"]), []).append({attr: keys})
+    return platforms
+
+
+def legacy_setup_descriptions(sensor_class, description_class) -> dict:
+    """Build descriptions like the former per entry SENSORS walk."""
+    descriptions = {}
+    for sensor, description in SENSORS.items():
+        for sensor_desc in description:
+            if sensor_desc["platform"] == sensor_class.__module__.split(".")[-1]:
+                sensor_description = description_class(sensor)
+                for key, value in sensor_desc.items():
+                    setattr(sensor_description, key, value)
+                descriptions[sensor] = sensor_description
+    return descriptions
+
+
+def legacy_setup(entries: int) -> None:
+    """Set up entries the former way."""
+    for _ in range(entries):
+        legacy_build_platforms(STOVE_SENSORS)
+        for sensor_class, description_class in PLATFORMS:
+            legacy_setup_descriptions(sensor_class, description_class)
+
+
+def registry_setup(entries: int) -> None:
+    """Set up entries with the description registry."""
+    for _ in range(entries):
+        FourHeatCoordinator.build_platforms(SimpleNamespace(sensors=STOVE_SENSORS))
+        for sensor_class, description_class in PLATFORMS:
+            _setup_descriptions(sensor_class, description_class)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    print(f"{len(SENSORS)} sensors, best of {REPEAT} runs")
+    print(f"{'entries':>8} {'former':>12} {'registry':>12} {'speedup':>8}")
+    for entries in ENTRIES:
+        former = min(
+            timeit.repeat(lambda: legacy_setup(entries), number=1, repeat=REPEAT)
+        )
+        registry = min(
+            timeit.repeat(lambda: registry_setup(entries), number=1, repeat=REPEAT)
+        )
+        print(
+            f"{entries:>8} {former * 1000:>9.2f} ms {registry * 1000:>9.2f} ms"
+            f" {former / registry:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""Local 4heat device simulator.
+
+An asyncio TCP server speaking the 4heat protocol, seeded with the sensors
+of const.SENSORS. It answers SEL 0 sweeps, SEC 3 reads and SEC 1 writes and
+on/off/unblock commands, and can inject latency, dropped connections,
+truncated frames and module reboot windows.
+
+Use it from benchmarks:
+
+    simulator = FourHeatSimulator(latency=0.02)
+    await simulator.start()
+    device = await FourHeatDevice.create("sim", "127.0.0.1", simulator.port)
+
+or run it standalone and point Home Assistant at it:
+
+    python -m benchmarks.simulator --port 8080 --latency 0.05
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from contextlib import suppress
+import json
+import random
+
+from custom_components.fourheat.const import (
+    DEVICE_STATE_SENSOR,
+    INFO_QUERY,
+    OFF_QUERY,
+    ON_QUERY,
+    RESULT_ERROR,
+    RESULT_INFO,
+    RESULT_OK,
+    SENSORS,
+    UNBLOCK_QUERY,
+)
+
+# Device state the simulated stove changes to after on/off/unblock commands
+COMMAND_STATES = {
+    ON_QUERY[2][1:6]: 1,  # Check up
+    OFF_QUERY[2][1:6]: 0,  # Off
+    UNBLOCK_QUERY[2][1:6]: 0,  # Off
+}
+
+
+def default_parameters() -> dict[str, tuple[str, int]]:
+    """Build the parameter table from const.SENSORS.
+
+    Parameters (2xxxx) are writable "B" records, everything else is a read
+    only "J" record. All values start at 0, which every sensor can display.
+    """
+    return {attr: ("B" if attr.startswith("2") else "J", 0) for attr in SENSORS}
+
+
+def record(sensor_type: str, attr: str, value: int) -> str:
+    """Format a single record."""
+    return f"{sensor_type}{attr}{str(value).zfill(12)}"
+
+
+class FourHeatSimulator:
+    """Simulated 4heat module."""
+
+    def __init__(
+        self,
+        parameters: dict[str, tuple[str, int]] | None = None,
+        *,
+        latency: float = 0,
+        jitter: float = 0,
+        connect_delay: float = 0,
+        drop_rate: float = 0,
+        truncate_rate: float = 0,
+        error_state: bool = False,
+        keep_alive: bool = False,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize the simulator.
+
+        latency and jitter are seconds added before every answer,
+        connect_delay before the first one of a connection. drop_rate
+        and truncate_rate the share of frames answered with a closed
+        connection or half a frame. In error_state SEL sweeps answer ERR.
+        With keep_alive a connection is kept open for following frames.
+        """
+        self.parameters = (
+            dict(parameters) if parameters is not None else default_parameters()
+        )
+        self.latency = latency
+        self.jitter = jitter
+        self.connect_delay = connect_delay
+        self.drop_rate = drop_rate
+        self.truncate_rate = truncate_rate
+        self.error_state = error_state
+        self.keep_alive = keep_alive
+        self.host = "127.0.0.1"
+        self.port = 0
+        self.connections = 0
+        self.frames = 0
+        self.dropped = 0
+        self.truncated = 0
+        self._random = random.Random(seed)
+        self._server: asyncio.Server | None = None
+        self._reboot: asyncio.Task | None = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        """Start listening, port 0 picks a free port."""
+        self.host = host
+        self._server = await asyncio.start_server(self._handle_client, host, port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Stop listening."""
+        if self._reboot:
+            self._reboot.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._reboot
+            self._reboot = None
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def reboot(self, duration: float) -> asyncio.Task:
+        """Refuse connections for duration seconds, like a rebooting module."""
+
+        async def _reboot() -> None:
+            if self._server:
+                self._server.close()
+                self._server = None
+            await asyncio.sleep(duration)
+            await self.start(self.host, self.port)
+            self._reboot = None
+
+        self._reboot = asyncio.create_task(_reboot())
+        return self._reboot
+
+    def answer(self, query: list[str]) -> list[str]:
+        """Build the answer fields to query fields."""
+        if query[:2] == INFO_QUERY:
+            if self.error_state:
+                return [RESULT_ERROR, "0"]
+            records = [
+                record(sensor_type, attr, value)
+                for attr, (sensor_type, value) in self.parameters.items()
+            ]
+            return [RESULT_INFO, str(len(records)), *records]
+        if query[:2] == [RESULT_OK, "3"]:
+            records = [
+                record(self.parameters[attr][0], attr, self.parameters[attr][1])
+                for attr in (field[1:6] for field in query[2:])
+                if attr in self.parameters
+            ]
+            return [RESULT_OK, str(len(records)), *records]
+        if query[:2] == [RESULT_OK, "1"] and len(query) > 2:
+            return [RESULT_OK, str(len(query) - 2), *map(self._write, query[2:])]
+        return [RESULT_ERROR, "0"]
+
+    def _write(self, field: str) -> str:
+        """Execute a single write record and return its acknowledgement."""
+        attr = field[1:6]
+        if attr in COMMAND_STATES:
+            sensor_type = self.parameters.get(DEVICE_STATE_SENSOR, ("J", 0))[0]
+            self.parameters[DEVICE_STATE_SENSOR] = (sensor_type, COMMAND_STATES[attr])
+            return record("I", attr, 0)
+        value = int(field[7:])
+        sensor_type = self.parameters.get(attr, ("B", 0))[0]
+        self.parameters[attr] = (sensor_type, value)
+        return record("A", attr, value)
+
+    async def _handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer the frames of a connection."""
+        self.connections += 1
+        try:
+            if self.connect_delay:
+                await asyncio.sleep(self.connect_delay)
+            while True:
+                try:
+                    frame = await reader.readuntil(b"]")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                    break
+                self.frames += 1
+                if self.latency or self.jitter:
+                    await asyncio.sleep(
+                        self.latency + self._random.uniform(0, self.jitter)
+                    )
+                if self._random.random() < self.drop_rate:
+                    self.dropped += 1
+                    break
+                try:
+                    query = json.loads(frame)
+                except ValueError:
+                    query = []
+                answer = bytes(json.dumps(self.answer(query)), "ascii")
+                if self._random.random() < self.truncate_rate:
+                    self.truncated += 1
+                    writer.write(answer[: len(answer) // 2])
+                    break
+                writer.write(answer)
+                await writer.drain()
+                if not self.keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            with suppress(OSError):
+                await writer.wait_closed()
+
+
+async def main() -> None:
+    """Run the simulator until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0)
+    parser.add_argument("--jitter", type=float, default=0)
+    parser.add_argument("--connect-delay", type=float, default=0)
+    parser.add_argument("--drop-rate", type=float, default=0)
+    parser.add_argument("--truncate-rate", type=float, default=0)
+    parser.add_argument("--error-state", action="store_true")
+    parser.add_argument("--keep-alive", action="store_true")
+    args = parser.parse_args()
+
+    simulator = FourHeatSimulator(
+        latency=args.latency,
+        jitter=args.jitter,
+        connect_delay=args.connect_delay,
+        drop_rate=args.drop_rate,
+        truncate_rate=args.truncate_rate,
+        error_state=args.error_state,
+        keep_alive=args.keep_alive,
+    )
+    await simulator.start(args.host, args.port)
+    print(f"4heat simulator listening on {simulator.host}:{simulator.port}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await simulator.stop()
+
+
+if __name__ == "__main__":
+    with suppress(KeyboardInterrupt):
+        asyncio.run(main())
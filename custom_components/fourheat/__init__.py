@@ -1,22 +1,42 @@
 """The 4heat integration."""
 from __future__ import annotations
 
+from contextlib import suppress
+from typing import Any
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import SERVICE_TURN_OFF, SERVICE_TURN_ON
 from homeassistant.core import HomeAssistant, ServiceCall, callback, valid_entity_id
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import entity_registry
+from homeassistant.helpers.service import async_extract_config_entry_ids
 from homeassistant.helpers.typing import ConfigType
 
-from .const import DATA_CONFIG_ENTRY, DOMAIN, LOGGER
-from .coordinator import FourHeatCoordinator, FourHeatEntryData, get_entry_data
+from .const import (
+    CONF_PERSISTENT_SESSION,
+    CONF_STALL_WATCHDOG,
+    DATA_CONFIG_ENTRY,
+    DATA_FLEET_SCHEDULER,
+    DOMAIN,
+    LOGGER,
+)
+from .coordinator import (
+    FourHeatCoordinator,
+    FourHeatEntryData,
+    get_catalog_store,
+    get_entry_data,
+)
 from .exceptions import FourHeatError, NotInitialized
 from .fourheat import FourHeatDevice
+from .scheduler import FleetPollScheduler
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the 4heat component."""
-    hass.data[DOMAIN] = {DATA_CONFIG_ENTRY: {}}
+    hass.data[DOMAIN] = {
+        DATA_CONFIG_ENTRY: {},
+        DATA_FLEET_SCHEDULER: FleetPollScheduler(),
+    }
     return True
 
 
@@ -36,9 +56,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     #     device = await FourHeatDevice.create(name, host, port, mode, False)
     # except FourHeatError as err:
     #     raise ConfigEntryNotReady(str(err)) from err
+    device.watchdog.enabled = entry.options.get(CONF_STALL_WATCHDOG, False)
+    device.persistent_session = entry.options.get(CONF_PERSISTENT_SESSION, False)
+    entry.async_on_unload(device.async_shutdown)
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
     fourheat_entry_data = get_entry_data(hass)[entry.entry_id]
 
-    fourheat_entry_data.coordinator = FourHeatCoordinator(hass, entry, device)
+    catalog = get_catalog_store(hass, entry)
+    if stored := await catalog.async_load():
+        # come up with the last known sensors, rediscover in the background
+        LOGGER.debug("Restoring %s sensors of %s", len(stored["sensors"]), name)
+        await device.async_restore(stored["sensors"])
+
+    fourheat_entry_data.coordinator = FourHeatCoordinator(hass, entry, device, catalog)
     fourheat_entry_data.coordinator.async_setup()
     if not fourheat_entry_data.coordinator.platforms:
         # it is the first init of device
@@ -50,25 +80,40 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             )
         except FourHeatError as err:
             raise ConfigEntryNotReady(str(err)) from err
+        fourheat_entry_data.coordinator.async_save_catalog()
     await hass.config_entries.async_forward_entry_setups(
         entry, fourheat_entry_data.coordinator.platforms
     )
+    if stored:
+        entry.async_create_background_task(
+            hass,
+            fourheat_entry_data.coordinator.async_refresh(),
+            f"{DOMAIN} {name} discovery",
+        )
+
+    def service_value(value: Any) -> int:
+        """Return a number given as is, as string or as state of an entity.
+
+        Raises ValueError for anything else, a typo must not reach the stove.
+        """
+        with suppress(TypeError, ValueError, OverflowError):
+            return int(float(value))
+        if isinstance(value, str) and valid_entity_id(value):
+            if (entity_state := hass.states.get(value)) is not None:
+                with suppress(ValueError, OverflowError):
+                    return int(float(entity_state.state))
+        raise ValueError(f"{value!r} is neither a number nor a number entity")
 
     @callback
     async def async_handle_set_value(call: ServiceCall) -> None:
         """Handle the service call to set a value."""
         entity_id = call.data.get("entity_id", "")
         value = call.data.get("value", 5)
-        val = 1
-        if isinstance(value, str):
-            if value.isnumeric():
-                val = int(value)
-            elif valid_entity_id(value):
-                entity_state = hass.states.get(value)
-                if entity_state is not None:
-                    val = int(float(entity_state.state))
-        else:
-            val = value
+        try:
+            val = service_value(value)
+        except ValueError as error:
+            LOGGER.error("Not setting %s: %s", entity_id, error)
+            return
 
         if valid_entity_id(entity_id):
             ent_reg = entity_registry.async_get(hass)
@@ -77,19 +122,53 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
             try:
                 assert entry is not None
-                await fourheat_entry_data.coordinator.device.async_set_state(
-                    entry.unique_id.split("-")[-1], val
-                )
-                fourheat_entry_data.coordinator.async_update_listeners()
+                attr = entry.unique_id.split("-")[-1]
+                await fourheat_entry_data.coordinator.device.async_set_state(attr, val)
+                fourheat_entry_data.coordinator.async_update_sensor_listeners([attr])
+                fourheat_entry_data.coordinator.async_schedule_read_back([attr])
             except FourHeatError as error:
                 LOGGER.exception("Setting %s to %s failed: %s", entity_id, value, error)
         else:
             LOGGER.error('"%s" is no valid entity ID', entity_id)
 
+    async def async_handle_set_values(call: ServiceCall) -> None:
+        """Handle the service call to set several values at once."""
+        ent_reg = entity_registry.async_get(hass)
+        by_entry: dict[str, dict[str, Any]] = {}
+        for entity_id, value in call.data.get("values", {}).items():
+            if not valid_entity_id(entity_id) or not (
+                reg_entry := ent_reg.async_get(entity_id)
+            ):
+                LOGGER.error('"%s" is no valid entity ID', entity_id)
+                continue
+            try:
+                val = service_value(value)
+            except ValueError as error:
+                # set all values or none of them
+                LOGGER.error("Not setting any value: %s", error)
+                return
+            attr = reg_entry.unique_id.split("-")[-1]
+            by_entry.setdefault(str(reg_entry.config_entry_id), {})[attr] = val
+
+        for entry_id, values in by_entry.items():
+            if (
+                entry_data := get_entry_data(hass).get(entry_id)
+            ) is None or not entry_data.coordinator:
+                LOGGER.error("4heat device of %s is not set up", list(values))
+                continue
+            try:
+                await entry_data.coordinator.device.async_set_states(values)
+            except (FourHeatError, AttributeError) as error:
+                LOGGER.exception("Setting %s failed: %s", values, error)
+                continue
+            entry_data.coordinator.async_update_sensor_listeners(values)
+            entry_data.coordinator.async_schedule_read_back(values)
+
     async def async_turn_on(call: ServiceCall) -> None:
         if not fourheat_entry_data.coordinator:
             raise NotInitialized
         await fourheat_entry_data.coordinator.device.async_send_command(SERVICE_TURN_ON)
+        fourheat_entry_data.coordinator.async_schedule_read_back()
 
     async def async_turn_off(call: ServiceCall) -> None:
         if not fourheat_entry_data.coordinator:
@@ -97,14 +176,42 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         await fourheat_entry_data.coordinator.device.async_send_command(
             SERVICE_TURN_OFF
         )
+        fourheat_entry_data.coordinator.async_schedule_read_back()
+
+    async def async_refresh(call: ServiceCall) -> None:
+        """Refresh the stoves of the targeted entities."""
+        for entry_id in await async_extract_config_entry_ids(hass, call):
+            if (
+                entry_data := get_entry_data(hass).get(entry_id)
+            ) is not None and entry_data.coordinator:
+                await entry_data.coordinator.async_request_refresh()
 
     hass.services.async_register(DOMAIN, "set_value", async_handle_set_value)
+    hass.services.async_register(DOMAIN, "set_values", async_handle_set_values)
     hass.services.async_register(DOMAIN, "turn_on", async_turn_on)
     hass.services.async_register(DOMAIN, "turn_off", async_turn_off)
+    hass.services.async_register(DOMAIN, "refresh", async_refresh)
 
     return True
 
 
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options, update intervals are read on every update.
+
+    A kept connection is closed with the next request once sessions are off.
+    """
+    fourheat_entry_data = get_entry_data(hass)[entry.entry_id]
+    if fourheat_entry_data.coordinator:
+        device = fourheat_entry_data.coordinator.device
+        device.watchdog.enabled = entry.options.get(CONF_STALL_WATCHDOG, False)
+        device.persistent_session = entry.options.get(CONF_PERSISTENT_SESSION, False)
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored sensor catalog of a removed entry."""
+    await get_catalog_store(hass, entry).async_remove()
+
+
 async def async_unload_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
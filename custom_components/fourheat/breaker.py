@@ -0,0 +1,101 @@
+"""Circuit breaker for 4heat device communication."""
+from __future__ import annotations
+
+from random import uniform
+from time import monotonic
+
+from .const import (
+    BREAKER_CLOSED,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_HALF_OPEN,
+    BREAKER_MAX_OPEN_TIME,
+    BREAKER_OPEN,
+    BREAKER_OPEN_TIME,
+    LOGGER,
+    RETRY_UPDATE_BACKOFF,
+    RETRY_UPDATE_SLEEP,
+)
+
+
+def _jitter(delay: float) -> float:
+    """Spread delay between its half and its full value."""
+    return uniform(delay / 2, delay)
+
+
+class CircuitBreaker:
+    """Stop talking to a device which keeps failing.
+
+    closed: requests pass, failures are retried with exponential backoff.
+    open: requests fail immediately until the open time has passed.
+    half_open: a single probe is let through, its result closes or reopens.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Initialize the circuit breaker."""
+        self.name = name
+        self.state = BREAKER_CLOSED
+        self.failures: int = 0
+        self.times_opened: int = 0
+        self._open_until: float = 0
+
+    @property
+    def is_open(self) -> bool:
+        """Return True while requests are rejected."""
+        return self.state == BREAKER_OPEN and monotonic() < self._open_until
+
+    @property
+    def retry_in(self) -> float:
+        """Seconds until the next probe is allowed."""
+        if self.state != BREAKER_OPEN:
+            return 0
+        return max(0, self._open_until - monotonic())
+
+    def allow_request(self) -> bool:
+        """Return True if a request may be sent.
+
+        When the open time has passed the breaker goes half-open and the
+        caller is expected to send a probe before anything else.
+        """
+        if self.state == BREAKER_OPEN and not self.is_open:
+            LOGGER.debug("Circuit of %s is half-open, probing", self.name)
+            self.state = BREAKER_HALF_OPEN
+        return self.state != BREAKER_OPEN
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        if self.state != BREAKER_CLOSED:
+            LOGGER.debug("Circuit of %s is closed again", self.name)
+        self.state = BREAKER_CLOSED
+        self.failures = 0
+        self.times_opened = 0
+
+    def record_failure(self) -> float:
+        """Count a failed request.
+
+        Returns the backoff in seconds before the next request, 0 if the
+        circuit opened and requests are rejected anyway.
+        """
+        self.failures += 1
+        if (
+            self.state == BREAKER_HALF_OPEN
+            or self.failures >= BREAKER_FAILURE_THRESHOLD
+        ):
+            self.times_opened += 1
+            open_time = _jitter(
+                min(
+                    BREAKER_OPEN_TIME * 2 ** (self.times_opened - 1),
+                    BREAKER_MAX_OPEN_TIME,
+                )
+            )
+            LOGGER.debug(
+                "Circuit of %s is open for %.1f seconds after %s failures",
+                self.name,
+                open_time,
+                self.failures,
+            )
+            self.state = BREAKER_OPEN
+            self._open_until = monotonic() + open_time
+            return 0
+        return _jitter(
+            min(RETRY_UPDATE_BACKOFF * 2 ** (self.failures - 1), RETRY_UPDATE_SLEEP)
+        )
@@ -71,3 +71,4 @@ class FourHeatButton(FourHeatAttributeEntity, ButtonEntity):
         if not self.entity_description.press_action:
             raise NotImplementedError("Please add button action in CONST.py")
         await self.entity_description.press_action(self.coordinator)
+        self.coordinator.async_schedule_read_back()
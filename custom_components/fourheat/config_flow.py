@@ -19,7 +19,18 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 import homeassistant.helpers.config_validation as cv
 
-from .const import DOMAIN, LOGGER, SENSORS, TCP_PORT
+from .const import (
+    CONF_MAX_UPDATE_INTERVAL,
+    CONF_MIN_UPDATE_INTERVAL,
+    CONF_PERSISTENT_SESSION,
+    CONF_STALL_WATCHDOG,
+    DEFAULT_MAX_UPDATE_INTERVAL,
+    DEFAULT_MIN_UPDATE_INTERVAL,
+    DOMAIN,
+    LOGGER,
+    SENSORS,
+    TCP_PORT,
+)
 from .exceptions import DeviceConnectionError
 from .fourheat import FourHeatDevice
 
@@ -32,6 +43,14 @@ class FourHeatConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     host: str = ""
     info: dict[str, Any] = {}
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> FourHeatOptionsFlow:
+        """Get the options flow for this handler."""
+        return FourHeatOptionsFlow(config_entry)
+
     def _host_in_configuration_exists(self, host) -> bool:
         """Return True if site_id exists in configuration."""
 
@@ -135,6 +154,57 @@ class FourHeatConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
 
+class FourHeatOptionsFlow(config_entries.OptionsFlow):
+    """4Heat options flow."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self.config_entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            if (
+                user_input[CONF_MIN_UPDATE_INTERVAL]
+                > user_input[CONF_MAX_UPDATE_INTERVAL]
+            ):
+                errors["base"] = "invalid_interval"
+            else:
+                return self.async_create_entry(title="", data=user_input)
+
+        options = self.config_entry.options
+        options_schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_MIN_UPDATE_INTERVAL,
+                    default=options.get(
+                        CONF_MIN_UPDATE_INTERVAL, DEFAULT_MIN_UPDATE_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=3600)),
+                vol.Required(
+                    CONF_MAX_UPDATE_INTERVAL,
+                    default=options.get(
+                        CONF_MAX_UPDATE_INTERVAL, DEFAULT_MAX_UPDATE_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=3600)),
+                vol.Optional(
+                    CONF_STALL_WATCHDOG,
+                    default=options.get(CONF_STALL_WATCHDOG, False),
+                ): bool,
+                vol.Optional(
+                    CONF_PERSISTENT_SESSION,
+                    default=options.get(CONF_PERSISTENT_SESSION, False),
+                ): bool,
+            }
+        )
+        return self.async_show_form(
+            step_id="init", data_schema=options_schema, errors=errors
+        )
+
+
 @callback
 def four_heat_entries(hass: HomeAssistant):
     """Return the hosts for the domain."""
@@ -0,0 +1,76 @@
+"""Connection manager shared by the 4heat devices of a process."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from time import monotonic
+
+from .const import HOST_CONCURRENCY, HOST_REQUEST_SPACING, LOGGER
+from .stats import HostStatistics
+
+
+class HostConnection:
+    """Coordinate the exchanges of all devices reachable through one host.
+
+    Several stoves may hide behind one serial to WiFi bridge, listening on
+    different ports. The bridge serves only concurrency exchanges at a time
+    and needs spacing seconds between their starts.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        concurrency: int = HOST_CONCURRENCY,
+        spacing: float = HOST_REQUEST_SPACING,
+    ) -> None:
+        """Initialize the host connection."""
+        self.host = host
+        self.concurrency = concurrency
+        self.spacing = spacing
+        self.statistics = HostStatistics()
+        self._slots = asyncio.Semaphore(concurrency)
+        self._spacing = asyncio.Lock()
+        self._last_request: float = 0
+
+    @asynccontextmanager
+    async def async_exchange(self) -> AsyncIterator[None]:
+        """Hold a slot of the host for one exchange."""
+        waiting_since = monotonic()
+        async with self._slots:
+            async with self._spacing:
+                if (delay := self._last_request + self.spacing - monotonic()) > 0:
+                    await asyncio.sleep(delay)
+                self._last_request = monotonic()
+            waited = monotonic() - waiting_since
+            self.statistics.waiting.record(waited)
+            if waited > 1:
+                LOGGER.debug("Waited %.1f seconds for host %s", waited, self.host)
+            yield
+
+    def record(self, sent: int, received: int) -> None:
+        """Count a successful exchange."""
+        self.statistics.requests += 1
+        self.statistics.bytes_sent += sent
+        self.statistics.bytes_received += received
+
+    def record_failure(self) -> None:
+        """Count a failed exchange."""
+        self.statistics.requests += 1
+        self.statistics.failures += 1
+
+
+_connections: dict[str, HostConnection] = {}
+
+
+def get_host_connection(host: str) -> HostConnection:
+    """Return the connection of a host, shared by all its devices."""
+    if (connection := _connections.get(host)) is None:
+        connection = _connections[host] = HostConnection(host)
+    return connection
+
+
+def set_host_limits(host: str, concurrency: int, spacing: float) -> HostConnection:
+    """Set the limits of a host, before any of its devices is created."""
+    connection = _connections[host] = HostConnection(host, concurrency, spacing)
+    return connection
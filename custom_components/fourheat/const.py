@@ -18,15 +18,51 @@ from homeassistant.helpers.entity import EntityCategory
 DOMAIN = "fourheat"
 LOGGER: Logger = getLogger(__package__)
 
-ENTRY_RELOAD_COOLDOWN = 20
 DATA_CONFIG_ENTRY: Final = "config_entry"
+DATA_FLEET_SCHEDULER: Final = "fleet_scheduler"
+STORAGE_VERSION = 1  # Version of the stored sensor catalog
+CATALOG_SAVE_DELAY = 10  # Seconds to collect changes before saving the catalog
+CATALOG_VALUES_SAVE_INTERVAL = 900  # Minimum seconds between saves of values only
 
 TCP_PORT = 80
-SOCKET_BUFFER = 1024
+SOCKET_BUFFER = 1024  # Bytes read from the socket at once
+MAX_FRAME_SIZE = 16384  # Upper bound for a single reply frame
 SOCKET_TIMEOUT = 10
 UPDATE_INTERVAL = 15  # Time in seconds between updates
+UPDATE_INTERVAL_STARTING = 5  # Time in seconds between updates while starting
+UPDATE_INTERVAL_IDLE = 150  # Time in seconds between updates while off
+CONF_MIN_UPDATE_INTERVAL = "min_update_interval"
+CONF_MAX_UPDATE_INTERVAL = "max_update_interval"
+DEFAULT_MIN_UPDATE_INTERVAL = UPDATE_INTERVAL_STARTING
+DEFAULT_MAX_UPDATE_INTERVAL = 300
+CONF_STALL_WATCHDOG = "stall_watchdog"
+CONF_PERSISTENT_SESSION = "persistent_session"
+DISCOVERY_INTERVAL = 600  # Time in seconds between full SEL sweeps
+SCHEDULE_SLACK = 1  # Seconds a sensor may be read ahead of its tier interval
 RETRY_UPDATE = 10
-RETRY_UPDATE_SLEEP = 5
+RETRY_UPDATE_SLEEP = 5  # Max backoff in seconds between failed tries
+RETRY_UPDATE_BACKOFF = 1  # First backoff in seconds, doubled on each failure
+BREAKER_FAILURE_THRESHOLD = 4  # Failed tries in a row opening the circuit
+BREAKER_OPEN_TIME = 30  # Seconds the circuit stays open, doubled on reopen
+BREAKER_MAX_OPEN_TIME = 600
+TRACE_BUFFER_SIZE = 64  # Frames kept for diagnostics
+TRACE_FRAME_SIZE = 512  # Bytes kept of each traced frame
+STALL_TICK = 0.05  # Seconds between event loop lag checks of the watchdog
+STALL_THRESHOLD = 0.1  # Seconds of event loop lag counted as a stall
+# Upper bounds in milliseconds of the command latency histogram buckets
+LATENCY_BUCKETS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+COMMAND_WORKER_IDLE = 60  # Seconds without commands before the worker stops
+GET_COALESCE_WINDOW = 0.05  # Seconds to collect reads into one GET frame
+GET_MAX_RECORDS = 20  # Records per GET frame
+SET_MAX_RECORDS = 10  # Records per SET frame
+HOST_CONCURRENCY = 1  # Exchanges at a time with one host, i.e. a WiFi bridge
+HOST_REQUEST_SPACING = 0.1  # Seconds between the starts of exchanges with a host
+DNS_CACHE_TTL = 300  # Seconds a resolved host name is used before resolving again
+SESSION_FALLBACK_CLOSES = 3  # Kept connections lost before giving up sessions
+READ_BACK_DELAY = 2  # Seconds after a write before the touched sensors are read
 ON_COMMAND = SERVICE_TURN_ON
 OFF_COMMAND = SERVICE_TURN_OFF
 UNBLOCK_COMMAND = "unblock"
@@ -53,6 +89,7 @@ RESULT_INFO = "SEL"
 RESULT_OK = "SEC"
 RESULT_ERROR = "ERR"
 DEVICE_STATE_SENSOR = "30001"
+DEVICE_ERROR_SENSOR = "30002"
 UNBLOCK_QUERY = ["SEC", "1", "J30255000000000001"]  # Full Unblock
 OFF_QUERY = ["SEC", "1", "J30254000000000001"]  # Full OFF
 ON_QUERY = ["SEC", "1", "J30253000000000001"]  # Full ON
@@ -79,6 +116,15 @@ CONF_MODES = {
         GET_COMMAND: GET_QUERY,
     },
 }
+# Lower number is sent first, user actions go ahead of routine polls
+COMMAND_PRIORITIES = {
+    SERVICE_TURN_ON: 0,
+    SERVICE_TURN_OFF: 0,
+    UNBLOCK_COMMAND: 0,
+    SET_COMMAND: 1,
+    GET_COMMAND: 2,
+    INFO_COMMAND: 3,
+}
 # TO DO 20211 is potentionally MAX POWER or must be made configurable
 MAX_POWER = 5
 
@@ -102,6 +148,8 @@ STATE_NAMES = {
     34: "Ignition",
 }
 STATES_OFF = [0, 7, 8, 9]
+STATES_IDLE = [0, 11]  # No need to poll often
+STATES_STARTING = [1, 2, 3, 4, 10, 30, 31, 32, 33, 34]  # Poll faster
 
 ERROR_NAMES = {
     0: "No",
@@ -140,6 +188,28 @@ if MAX_POWER:
         POWER_NAMES[x] = "P" + str(x)
     POWER_NAMES[MAX_POWER + 1] = "Auto"
 
+# Refresh tiers in seconds. Sensors are read only when their tier is due.
+POLL_TIERS = {
+    "fast": 0,  # Every update
+    "normal": 60,
+    "slow": 900,
+}
+POLL_TIER_DEFAULT = "normal"
+# Default tier by first digit of the sensor id:
+# 3xxxx are live readings, 2xxxx configuration parameters
+POLL_TIER_BY_CLASS = {
+    "3": "fast",
+    "2": "slow",
+}
+SENSOR_POLL_TIERS = {
+    "30003": "normal",  # Timer
+    "30004": "normal",  # Ignition
+    "30007": "normal",  # Inputs
+    "20493": "normal",  # Room temperature set point
+    "21700": "normal",  # Room thermostat
+    "50001": "fast",  # Auger on
+}
+
 SENSORS: dict[str, list[dict]] = {
     # Sensors list (str, dict(str,str|list))
     # "id": str                 unique_id coming from device
@@ -1,27 +1,46 @@
 """Provides the 4heat DataUpdateCoordinator."""
 from __future__ import annotations
 
-from collections.abc import Coroutine
+from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass
-from datetime import timedelta
+from datetime import datetime, timedelta
+from time import monotonic
 from typing import Any, cast
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers import device_registry, entity_registry
-from homeassistant.helpers.debounce import Debouncer
+from homeassistant.const import CONF_MONITORED_CONDITIONS
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import device_registry, entity_registry, event
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .const import (
+    CATALOG_SAVE_DELAY,
+    CATALOG_VALUES_SAVE_INTERVAL,
+    CONF_MAX_UPDATE_INTERVAL,
+    CONF_MIN_UPDATE_INTERVAL,
     DATA_CONFIG_ENTRY,
+    DATA_FLEET_SCHEDULER,
+    DEFAULT_MAX_UPDATE_INTERVAL,
+    DEFAULT_MIN_UPDATE_INTERVAL,
+    DEVICE_ERROR_SENSOR,
+    DEVICE_STATE_SENSOR,
+    DISCOVERY_INTERVAL,
     DOMAIN,
-    ENTRY_RELOAD_COOLDOWN,
     LOGGER,
-    SENSORS,
+    READ_BACK_DELAY,
+    STATES_IDLE,
+    STATES_STARTING,
+    STORAGE_VERSION,
     UPDATE_INTERVAL,
+    UPDATE_INTERVAL_IDLE,
+    UPDATE_INTERVAL_STARTING,
 )
+from .descriptions import sensor_platforms
 from .exceptions import FourHeatError
 from .fourheat import FourHeatDevice
+from .scheduler import FleetPollScheduler, SensorPollScheduler
 
 
 @dataclass
@@ -37,11 +56,20 @@ def get_entry_data(hass: HomeAssistant) -> dict[str, FourHeatEntryData]:
     return cast(dict[str, FourHeatEntryData], hass.data[DOMAIN][DATA_CONFIG_ENTRY])
 
 
+def get_catalog_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    """Return the store of the sensor catalog of a config entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}")
+
+
 class FourHeatCoordinator(DataUpdateCoordinator):
     """Class to manage fetching 4heat data."""
 
     def __init__(
-        self, hass: HomeAssistant, entry: ConfigEntry, device: FourHeatDevice
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        device: FourHeatDevice,
+        catalog: Store | None = None,
     ) -> None:
         """Init the coorditator."""
         self.device_id: str | None = None
@@ -49,9 +77,33 @@ class FourHeatCoordinator(DataUpdateCoordinator):
         self.entry = entry
         self.device = device
         self.sensors: dict[str, dict] = {}
-        self.platforms: dict[str, list[dict[str, dict]]] = {}
+        self.platforms: dict[str, list[dict[str, Mapping[str, Any]]]] = {}
         self._update_is_running: bool = False
-        self.unload_platforms: dict | None = None
+        self._last_discovery: float | None = None
+        self.poll_scheduler = SensorPollScheduler()
+        self._failed_updates: int = 0
+        self._changed_sensors: set[str] = set()
+        self._sensor_listeners: dict[str, list[CALLBACK_TYPE]] = {}
+        self._last_available: bool | None = None
+        self.suppressed_writes: int = 0
+        self._last_state: int | None = None
+        self._entity_adders: dict[str, Callable[[Iterable[str]], None]] = {}
+        # sensors the platforms were built for, device.sensors grows in place
+        self._known_sensors: set[str] = set()
+        self.fleet: FleetPollScheduler | None = hass.data.get(DOMAIN, {}).get(
+            DATA_FLEET_SCHEDULER
+        )
+        self._scheduled_poll: float | None = None
+        self._read_back: set[str] = set()
+        self._unsub_read_back: CALLBACK_TYPE | None = None
+        self.catalog = catalog
+        self.last_seen: str | None = None
+        # sensor ids and types of the last save and its monotonic time
+        self._catalog_layout: dict[str, Any] | None = None
+        self._catalog_saved: float | None = None
+        self.monitored_conditions: list[str] = list(
+            entry.data.get(CONF_MONITORED_CONDITIONS) or []
+        )
 
         super().__init__(
             hass,
@@ -59,13 +111,6 @@ class FourHeatCoordinator(DataUpdateCoordinator):
             name=device.name,
             update_interval=timedelta(seconds=UPDATE_INTERVAL),
         )
-        self._debounced_reload: Debouncer[Coroutine[Any, Any, None]] = Debouncer(
-            hass,
-            LOGGER,
-            cooldown=ENTRY_RELOAD_COOLDOWN,
-            immediate=False,
-            function=self._async_reload_entry,
-        )
         if not self.device.initialized:
             sensors = {}
             ent_reg = entity_registry.async_get(hass)
@@ -73,7 +118,11 @@ class FourHeatCoordinator(DataUpdateCoordinator):
                 ent_reg, self.entry.entry_id
             )
             for sensor in entries:
-                sensors[sensor.unique_id.split("-")[-1]] = {
+                attr = sensor.unique_id.split("-")[-1]
+                if not attr.isdigit():
+                    # not a device attribute, i.e. communication statistics
+                    continue
+                sensors[attr] = {
                     "sensor_type": None,
                     "value": None,
                 }
@@ -82,80 +131,111 @@ class FourHeatCoordinator(DataUpdateCoordinator):
             self.sensors = device.sensors
         self.platforms = self.build_platforms()
 
-        entry.async_on_unload(self._debounced_reload.async_cancel)
+        if self.fleet is not None:
+            self.fleet.add(entry.entry_id)
+            entry.async_on_unload(self._async_leave_fleet)
         entry.async_on_unload(
             self.async_add_listener(self._async_device_updates_handler)
         )
+        entry.async_on_unload(self._async_cancel_read_back)
 
     @callback
     def build_platforms(
         self,
-    ) -> dict[str, list[dict[str, dict]]]:
+    ) -> dict[str, list[dict[str, Mapping[str, Any]]]]:
         """Find available platforms."""
         platforms: dict[str, list] = {}
+        self._known_sensors = set(self.sensors)
         if not self.sensors:
             return platforms
+        known = sensor_platforms()
         for attr in self.sensors:
-            try:
-                sensor_conf = SENSORS[attr]
-            except KeyError:
+            if (sensor_conf := known.get(attr)) is None:
                 LOGGER.warning(
                     "Sensor %s is not known. Please inform the mainteainer", attr
                 )
-                sensor_conf = [
-                    {
-                        "name": f"UN {attr}",
-                        "platform": "sensor",
-                    }
-                ]
-            for sensor in sensor_conf:
-                sensor_description = {}
-                keys = {}
-                try:
-                    platform = str(sensor["platform"])
-                except KeyError:
-                    LOGGER.warning(
-                        "Mandatory config entry 'platforms' for sensor %s is missing. Please contact maintainer",
-                        attr,
-                    )
-                    platform = "sensor"
-                for key, value in sensor.items():
-                    if key != "platform":
-                        if value:
-                            keys[key] = value
-                        else:
-                            LOGGER.debug(
-                                "Empty value for %s in sensor %s configuration",
-                                key,
-                                attr,
-                            )
-                if keys:
-                    sensor_description[attr] = keys
-
-                if platform not in platforms:
-                    platforms[platform] = []
-                platforms[platform].append(sensor_description)
+                sensor_conf = {"sensor": {"name": f"UN {attr}"}}
+            for platform, keys in sensor_conf.items():
+                platforms.setdefault(platform, []).append({attr: keys})
         return platforms
 
-    async def _async_reload_entry(self) -> None:
-        """Reload entry."""
-        LOGGER.debug("Reloading entry %s", self.name)
-        await self.hass.config_entries.async_reload(self.entry.entry_id)
+    @callback
+    def async_add_entity_adder(
+        self, platform: str, add_entities: Callable[[Iterable[str]], None]
+    ) -> CALLBACK_TYPE:
+        """Register how a set up platform adds entities of new sensors."""
+        self._entity_adders[platform] = add_entities
+
+        @callback
+        def remove_adder() -> None:
+            self._entity_adders.pop(platform, None)
+
+        return remove_adder
+
+    @callback
+    def async_add_sensor_listener(
+        self, attr: str, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for updates of a single sensor."""
+        listeners = self._sensor_listeners.setdefault(attr, [])
+        listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            listeners.remove(update_callback)
+            if not listeners:
+                del self._sensor_listeners[attr]
+
+        return remove_listener
+
+    @callback
+    def async_update_sensor_listeners(self, attrs: Iterable[str] | None = None) -> None:
+        """Update listeners of the given sensors, all of them if None."""
+        woken = 0
+        for attr, listeners in list(self._sensor_listeners.items()):
+            if attrs is None or attr in attrs:
+                for update_callback in list(listeners):
+                    update_callback()
+                woken += len(listeners)
+            else:
+                self.suppressed_writes += len(listeners)
+        LOGGER.debug("Updated %s listeners of %s", woken, self.name)
 
     @callback
     def _async_device_updates_handler(self) -> None:
-        """Finish async init."""
-        if self.sensors.keys() != self.device.sensors.keys():
-            self.unload_platforms = self.platforms
-            self.sensors = self.device.sensors
-            self.platforms = self.build_platforms()
-            self.async_setup()
+        """Finish async init and wake listeners of changed sensors."""
+        if self.last_update_success != self._last_available:
+            # availability of every entity changed
+            self._last_available = self.last_update_success
+            self.async_update_sensor_listeners()
+        else:
+            self.async_update_sensor_listeners(self._changed_sensors)
+        self._changed_sensors = set()
+        if self.device.sensors.keys() != self._known_sensors:
+            self._async_add_new_sensors()
+
+    @callback
+    def _async_add_new_sensors(self) -> None:
+        """Add entities of newly discovered sensors to the set up platforms.
+
+        Existing entities stay untouched, only platforms not set up yet are
+        forwarded.
+        """
+        new_sensors = self.device.sensors.keys() - self._known_sensors
+        LOGGER.debug("Adding new sensors of %s: %s", self.name, new_sensors)
+        self.sensors = self.device.sensors
+        self.platforms = self.build_platforms()
+        self.async_setup()
+        for add_entities in self._entity_adders.values():
+            add_entities(new_sensors)
+        if missing := [
+            platform
+            for platform in self.platforms
+            if platform not in self._entity_adders
+        ]:
             self.hass.async_create_task(
-                self.hass.config_entries.async_forward_entry_setups(
-                    self.entry, self.platforms
-                )
+                self.hass.config_entries.async_forward_entry_setups(self.entry, missing)
             )
-            self.hass.async_create_task(self._debounced_reload.async_call())
 
     async def _async_update_data(self, init: bool = False) -> None:
         """Update data via device library."""
@@ -166,19 +246,201 @@ class FourHeatCoordinator(DataUpdateCoordinator):
         if self._update_is_running:
             LOGGER.debug("Last update try is still running. Canceling new one")
             return
+        if self.device.breaker.is_open:
+            # don't queue updates the device would reject anyway
+            self._adapt_update_interval()
+            raise UpdateFailed(
+                f"Device is not answering, next try in "
+                f"{self.device.breaker.retry_in:.0f} seconds"
+            )
         self._update_is_running = True
 
         try:
-            await self.device.async_update_data()
+            now = monotonic()
+            if (polled := self.sensors_to_poll(now)) is None:
+                self._changed_sensors |= await self.device.async_update_data()
+                self._last_discovery = now
+                self.poll_scheduler.mark_polled(self.device.sensors, now)
+                self.async_save_catalog()
+            elif polled:
+                self._changed_sensors |= await self.device.async_update_data(polled)
+                self.poll_scheduler.mark_polled(polled, now)
+            else:
+                LOGGER.debug("No sensor of %s is due for update", self.name)
         except FourHeatError as error:
             self.last_exception = error
+            self._failed_updates += 1
             LOGGER.debug(
                 "Update of data failed: %s",
                 repr(error),
             )
             raise UpdateFailed from error
+        else:
+            self._failed_updates = 0
         finally:
             self._update_is_running = False
+            self._adapt_update_interval()
+
+    @callback
+    def async_save_catalog(self) -> None:
+        """Save the discovered sensors with their last values.
+
+        Found, lost or changed sensors are saved soon, new values alone at
+        most every CATALOG_VALUES_SAVE_INTERVAL to spare the storage.
+        """
+        if self.catalog is None:
+            return
+        self.last_seen = dt_util.utcnow().isoformat()
+        now = monotonic()
+        layout = {
+            attr: sensor["sensor_type"] for attr, sensor in self.device.sensors.items()
+        }
+        if (
+            layout == self._catalog_layout
+            and self._catalog_saved is not None
+            and now - self._catalog_saved < CATALOG_VALUES_SAVE_INTERVAL
+        ):
+            return
+        self._catalog_layout = layout
+        self._catalog_saved = now
+        self.catalog.async_delay_save(self._catalog_data, CATALOG_SAVE_DELAY)
+
+    @callback
+    def _catalog_data(self) -> dict[str, Any]:
+        """Return the sensor catalog to store."""
+        return {"sensors": self.device.sensors, "last_seen": self.last_seen}
+
+    @callback
+    def async_schedule_read_back(self, attrs: Iterable[str] | None = None) -> None:
+        """Read sensors touched by a write shortly after it.
+
+        Without attrs the state and error sensors changed by on, off and
+        unblock commands are read, and polling speeds up for the new state.
+        Read backs within READ_BACK_DELAY are merged into one GET.
+        """
+        self._read_back.update(
+            (DEVICE_STATE_SENSOR, DEVICE_ERROR_SENSOR) if attrs is None else attrs
+        )
+        if attrs is None:
+            self._async_state_changed()
+        if self._unsub_read_back is None:
+            self._unsub_read_back = event.async_call_later(
+                self.hass, READ_BACK_DELAY, self._async_read_back
+            )
+
+    async def _async_read_back(self, _now: datetime) -> None:
+        """Read back written sensors and update only their entities."""
+        self._unsub_read_back = None
+        attrs, self._read_back = list(self._read_back), set()
+        try:
+            changed = await self.device.async_update_data(attrs)
+        except FourHeatError as error:
+            LOGGER.debug("Read back of %s failed: %s", attrs, repr(error))
+            return
+        self.poll_scheduler.mark_polled(attrs)
+        if DEVICE_STATE_SENSOR in changed:
+            self._async_state_changed()
+        # wake even unchanged sensors, their state is confirmed now
+        self.async_update_sensor_listeners(attrs)
+
+    @callback
+    def _async_state_changed(self) -> None:
+        """Poll at the pace of a changed device state from now on."""
+        # a changed state is polled fast until it settles
+        self._last_state = None
+        self._adapt_update_interval()
+        self._schedule_refresh()
+
+    @callback
+    def _async_cancel_read_back(self) -> None:
+        """Cancel a scheduled read back."""
+        if self._unsub_read_back is not None:
+            self._unsub_read_back()
+            self._unsub_read_back = None
+
+    @callback
+    def _async_leave_fleet(self) -> None:
+        """Give the poll slot of the device to the remaining ones."""
+        if self.fleet is not None:
+            self.fleet.remove(self.entry.entry_id)
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule the next poll into the slot of the device in the fleet."""
+        if self.fleet is None or self.update_interval is None:
+            super()._schedule_refresh()
+            return
+        if self.config_entry and self.config_entry.pref_disable_polling:
+            return
+        self._async_unsub_refresh()
+        self._scheduled_poll = self.fleet.next_poll(
+            self.entry.entry_id,
+            self.update_interval.total_seconds(),
+            dt_util.utcnow().timestamp(),
+        )
+        self._unsub_refresh = event.async_track_point_in_utc_time(
+            self.hass,
+            self._job,
+            dt_util.utc_from_timestamp(self._scheduled_poll),
+        )
+
+    async def _handle_refresh_interval(self, _now: datetime) -> None:
+        """Record how late the scheduled poll starts."""
+        if self._scheduled_poll is not None:
+            self.device.statistics.poll_jitter.record(
+                max(0.0, dt_util.utcnow().timestamp() - self._scheduled_poll)
+            )
+            self._scheduled_poll = None
+        await super()._handle_refresh_interval(_now)
+
+    @callback
+    def _adapt_update_interval(self) -> None:
+        """Set the interval until the next update.
+
+        Poll fast while the stove is starting or just changed its state, slow
+        while it is off or in standby, back off after failed updates and wait
+        for the device circuit breaker to allow a probe.
+        The result is kept within the configured bounds.
+        """
+        state = self.device.sensors.get(DEVICE_STATE_SENSOR, {}).get("value")
+        if self.device.breaker.is_open:
+            interval = self.device.breaker.retry_in
+        elif self._failed_updates:
+            interval = UPDATE_INTERVAL * 2 ** min(self._failed_updates, 8)
+        elif state in STATES_STARTING or state != self._last_state:
+            interval = UPDATE_INTERVAL_STARTING
+        elif state in STATES_IDLE:
+            interval = UPDATE_INTERVAL_IDLE
+        else:
+            interval = UPDATE_INTERVAL
+        self._last_state = state
+        min_interval = self.entry.options.get(
+            CONF_MIN_UPDATE_INTERVAL, DEFAULT_MIN_UPDATE_INTERVAL
+        )
+        max_interval = self.entry.options.get(
+            CONF_MAX_UPDATE_INTERVAL, DEFAULT_MAX_UPDATE_INTERVAL
+        )
+        self.update_interval = timedelta(
+            seconds=max(min_interval, min(interval, max_interval))
+        )
+
+    def sensors_to_poll(self, now: float) -> list[str] | None:
+        """Sensors due for reading, None for a full SEL sweep.
+
+        Sensors are read by their refresh tier, limited to the monitored
+        ones if only part of them is. A full sweep runs every
+        DISCOVERY_INTERVAL seconds or when most sensors are due anyway.
+        """
+        if (
+            self._last_discovery is None
+            or now - self._last_discovery >= DISCOVERY_INTERVAL
+        ):
+            return None
+        monitored = self.monitored_conditions or self.device.sensors
+        due = self.poll_scheduler.due(monitored, now)
+        if 2 * len(due) >= len(self.device.sensors):
+            return None
+        return due
 
     def async_setup(self) -> None:
         """Set up the coordinator."""
@@ -0,0 +1,59 @@
+"""Registry of 4heat entity descriptions built once per process."""
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import fields
+from functools import cache
+from types import MappingProxyType
+from typing import Any, TypeVar
+
+from homeassistant.helpers.entity import EntityDescription
+
+from .const import LOGGER, SENSORS
+
+_DescriptionT = TypeVar("_DescriptionT", bound=EntityDescription)
+
+# SENSORS keys describing the sensor itself, not its entity
+_REGISTRY_KEYS = {"platform", "id"}
+
+
+@cache
+def sensor_platforms() -> Mapping[str, Mapping[str, Mapping[str, Any]]]:
+    """Return the configuration of SENSORS indexed by sensor id and platform."""
+    index: dict[str, dict[str, Mapping[str, Any]]] = {}
+    for attr, sensor_conf in SENSORS.items():
+        for sensor in sensor_conf:
+            if (platform := sensor.get("platform")) is None:
+                LOGGER.warning(
+                    "Mandatory config entry 'platforms' for sensor %s is missing. Please contact maintainer",
+                    attr,
+                )
+                platform = "sensor"
+            index.setdefault(attr, {})[platform] = MappingProxyType(
+                {key: value for key, value in sensor.items() if key != "platform"}
+            )
+    return MappingProxyType(index)
+
+
+@cache
+def get_descriptions(
+    platform: str, description_class: Callable[..., _DescriptionT]
+) -> Mapping[str, _DescriptionT]:
+    """Return the descriptions of a platform indexed by sensor id.
+
+    Built on first use and shared by every config entry afterwards, so the
+    descriptions must not be changed.
+    """
+    known = {field.name for field in fields(description_class)}  # type: ignore[arg-type]
+    descriptions: dict[str, _DescriptionT] = {}
+    for attr, platforms in sensor_platforms().items():
+        if (sensor := platforms.get(platform)) is None:
+            continue
+        if unknown := sensor.keys() - known - _REGISTRY_KEYS:
+            LOGGER.warning(
+                "Unknown keys %s in configuration of sensor %s", unknown, attr
+            )
+        descriptions[attr] = description_class(
+            key=attr, **{key: value for key, value in sensor.items() if key in known}
+        )
+    return MappingProxyType(descriptions)
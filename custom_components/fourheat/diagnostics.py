@@ -0,0 +1,75 @@
+"""Diagnostics support for 4heat."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import REDACTED, async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from .coordinator import get_entry_data
+
+TO_REDACT = {CONF_HOST}
+
+
+def _redact_addresses(text: str, addresses: set[str]) -> str:
+    """Redact host names and ip addresses quoted in error messages."""
+    for address in addresses:
+        text = text.replace(address, REDACTED)
+    return text
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = get_entry_data(hass)[entry.entry_id].coordinator
+    diagnostics: dict[str, Any] = {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT)
+    }
+    if not coordinator:
+        return diagnostics
+
+    device = coordinator.device
+    # connection errors name the host and the address they failed on
+    addresses = {
+        address
+        for address in (device.host, device.options.host, device.options.ip_address)
+        if address
+    }
+    diagnostics["device"] = {
+        "initialized": device.initialized,
+        "mode": device.mode,
+        "model": device.model,
+        "stall_watchdog": device.watchdog.enabled,
+        "persistent_session": device.persistent_session,
+        "last_error": _redact_addresses(repr(device.last_error), addresses)
+        if device.last_error
+        else None,
+        "breaker": {
+            "state": device.breaker.state,
+            "failures": device.breaker.failures,
+            "times_opened": device.breaker.times_opened,
+            "retry_in": device.breaker.retry_in,
+        },
+    }
+    diagnostics["coordinator"] = {
+        "last_update_success": coordinator.last_update_success,
+        "update_interval": coordinator.update_interval.total_seconds()
+        if coordinator.update_interval
+        else None,
+        "monitored_conditions": coordinator.monitored_conditions,
+        "suppressed_writes": coordinator.suppressed_writes,
+        "poll_phase": coordinator.fleet.phase(entry.entry_id)
+        if coordinator.fleet
+        else None,
+    }
+    diagnostics["sensors"] = device.sensors
+    diagnostics["statistics"] = device.statistics.as_dict()
+    diagnostics["host"] = device.connection.statistics.as_dict()
+    diagnostics["trace"] = [
+        {**entry, "frame": _redact_addresses(entry["frame"], addresses)}
+        for entry in device.trace.as_list()
+    ]
+    return diagnostics
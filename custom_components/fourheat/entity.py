@@ -1,7 +1,7 @@
 """4heat entity helper."""
 from __future__ import annotations
 
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass
 from typing import Any, cast
 
@@ -14,8 +14,9 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import LOGGER, SENSORS
+from .const import LOGGER
 from .coordinator import FourHeatCoordinator, get_entry_data
+from .descriptions import get_descriptions
 from .exceptions import FourHeatError
 from .fourheat import FourHeatDevice
 from .utils import get_device_entity_name, get_device_name
@@ -42,7 +43,8 @@ class FourHeatEntity(CoordinatorEntity[FourHeatCoordinator]):
         super().__init__(coordinator)
         self.device = device
         self._attr_name = get_device_name(coordinator)
-        self._attr_should_poll = True
+        # state is pushed by the coordinator, polling would only add refreshes
+        self._attr_should_poll = False
         self._attr_device_info = DeviceInfo(
             identifiers={("serial", str(coordinator.serial))}
         )
@@ -57,10 +59,6 @@ class FourHeatEntity(CoordinatorEntity[FourHeatCoordinator]):
         """When entity is added to HASS."""
         self.async_on_remove(self.coordinator.async_add_listener(self._update_callback))
 
-    async def async_update(self) -> None:
-        """Update entity with latest info."""
-        await self.coordinator.async_request_refresh()
-
     @callback
     def _update_callback(self) -> None:
         """Handle device update."""
@@ -100,6 +98,15 @@ class FourHeatAttributeEntity(FourHeatEntity, entity.Entity):
         self._attr_unique_id: str = f"{super().unique_id}-{self.attribute}"
         self._attr_name = get_device_entity_name(coordinator, description.name)
 
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to HASS."""
+        # woken only when this attribute changes
+        self.async_on_remove(
+            self.coordinator.async_add_sensor_listener(
+                self.attribute, self._update_callback
+            )
+        )
+
     @property
     def attribute_value(self) -> StateType:
         """Value of sensor."""
@@ -136,48 +143,54 @@ def async_setup_entry_attribute_entities(
     sensors_descriptions: Mapping[str, FourHeatEntityDescription],
     sensor_class: Callable,
 ) -> None:
-    """Set up entities for attributes."""
+    """Set up entities for attributes.
+
+    Entities of sensors discovered later are added through the coordinator
+    without reloading the entry.
+    """
     coordinator = get_entry_data(hass)[config_entry.entry_id].coordinator
 
     assert coordinator
-    entities: list[FourHeatAttributeEntity] = []
-
-    for attribute in coordinator.sensors:
-        description = sensors_descriptions.get(attribute)
-
-        if description is None:
-            continue
-
-        # Filter and remove entities that according to settings should not create an entity
-        # if description.removal_condition and description.removal_condition(
-        #     coordinator.device.settings, coordinator.device
-        # ):
-        #     domain = sensor_class.__module__.split(".")[-1]
-        #     unique_id = f"{coordinator.serial}-{coordinator.device.description}-{domain}-{sensor}"
-        #     async_remove_fourheat_entity(hass, domain, unique_id)
-        # else:
-        entities.append(
-            sensor_class(coordinator, coordinator.device, attribute, description)
-        )
+    added: set[str] = set()
 
-    if not entities:
-        return
-    async_add_entities(entities)
+    @callback
+    def _async_add_attribute_entities(attributes: Iterable[str]) -> None:
+        """Add entities of attributes not added yet."""
+        entities: list[FourHeatAttributeEntity] = []
+        for attribute in attributes:
+            description = sensors_descriptions.get(attribute)
+
+            if description is None or attribute in added:
+                continue
+
+            # Filter and remove entities that according to settings should not create an entity
+            # if description.removal_condition and description.removal_condition(
+            #     coordinator.device.settings, coordinator.device
+            # ):
+            #     domain = sensor_class.__module__.split(".")[-1]
+            #     unique_id = f"{coordinator.serial}-{coordinator.device.description}-{domain}-{sensor}"
+            #     async_remove_fourheat_entity(hass, domain, unique_id)
+            # else:
+            added.add(attribute)
+            entities.append(
+                sensor_class(coordinator, coordinator.device, attribute, description)
+            )
+
+        if entities:
+            async_add_entities(entities)
+
+    _async_add_attribute_entities(coordinator.sensors)
+    config_entry.async_on_unload(
+        coordinator.async_add_entity_adder(
+            sensor_class.__module__.split(".")[-1], _async_add_attribute_entities
+        )
+    )
 
 
 @callback
 def _setup_descriptions(
     sensor_class: Callable[..., FourHeatAttributeEntity],
-    description_class: Callable[[str], FourHeatEntityDescription],
-) -> dict[str, FourHeatEntityDescription]:
-    """Build descriptions from .const SENSORS by platform."""
-
-    descriptions: dict[str, FourHeatEntityDescription] = {}
-    for sensor, description in SENSORS.items():
-        for sensor_desc in description:
-            if sensor_desc["platform"] == sensor_class.__module__.split(".")[-1]:
-                sensor_description = description_class(sensor)
-                for key, value in sensor_desc.items():
-                    setattr(sensor_description, key, value)
-                descriptions[sensor] = sensor_description
-    return descriptions
+    description_class: Callable[..., FourHeatEntityDescription],
+) -> Mapping[str, FourHeatEntityDescription]:
+    """Return the prebuilt descriptions of .const SENSORS for the platform."""
+    return get_descriptions(sensor_class.__module__.split(".")[-1], description_class)
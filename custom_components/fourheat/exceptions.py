@@ -24,3 +24,7 @@ class CommandError(FourHeatError):
 
 class InvalidCommand(FourHeatError):
     """Exception raised when invalid command is received."""
+
+
+class CircuitOpenError(DeviceConnectionError):
+    """Exception raised when requests are rejected after repeated failures."""
@@ -1,25 +1,35 @@
 """Provides the 4heat device class."""
 from __future__ import annotations
 
-from ast import literal_eval
 import asyncio
+from collections.abc import Iterable, Mapping
+from contextlib import suppress
 from dataclasses import dataclass
 import ipaddress
-
-# import queue
-from socket import AF_INET, SOCK_STREAM, gethostbyname, socket
+from itertools import count
+from socket import AF_INET, SOCK_STREAM
+from time import monotonic
 from typing import Any, Literal, Union, cast
 
 from homeassistant.const import STATE_OFF, STATE_ON
 from homeassistant.helpers.typing import StateType
 
+from .breaker import CircuitBreaker
+from .connection import get_host_connection
 from .const import (
+    BREAKER_HALF_OPEN,
+    COMMAND_PRIORITIES,
+    COMMAND_WORKER_IDLE,
     CONF_MODE,
     CONF_MODES,
     DEVICE_STATE_SENSOR,
+    DNS_CACHE_TTL,
+    GET_COALESCE_WINDOW,
     GET_COMMAND,
+    GET_MAX_RECORDS,
     INFO_COMMAND,
     LOGGER,
+    MAX_FRAME_SIZE,
     OFF_COMMAND,
     ON_COMMAND,
     ON_ERROR_QUERY,
@@ -27,8 +37,9 @@ from .const import (
     RESULT_INFO,
     RESULT_OK,
     RETRY_UPDATE,
-    RETRY_UPDATE_SLEEP,
+    SESSION_FALLBACK_CLOSES,
     SET_COMMAND,
+    SET_MAX_RECORDS,
     SOCKET_BUFFER,
     SOCKET_TIMEOUT,
     STATES_OFF,
@@ -36,6 +47,7 @@ from .const import (
     UNBLOCK_COMMAND,
 )
 from .exceptions import (
+    CircuitOpenError,
     CommandError,
     DeviceConnectionError,
     FourHeatError,
@@ -43,6 +55,9 @@ from .exceptions import (
     InvalidMessage,
     NotInitialized,
 )
+from .protocol import FourHeatRecord, build_frame, parse_frame
+from .stats import CommandStatistics, DeviceStatistics, ProtocolTrace
+from .watchdog import StallWatchdog
 
 
 @dataclass
@@ -52,25 +67,52 @@ class ConnectionOptions:
     ip_address: str
     port: int = TCP_PORT
     mode: bool = False
+    host: str | None = None  # Configured host name, None for an ip address
+    resolved: float = 0  # Monotonic time of the last resolution, 0 if never
+
+    @property
+    def expired(self) -> bool:
+        """Return True if the ip address needs to be resolved again."""
+        if not self.resolved:
+            return True
+        return self.host is not None and monotonic() - self.resolved >= DNS_CACHE_TTL
+
+    def invalidate(self) -> None:
+        """Resolve the host name again before the next connection."""
+        if self.host is not None:
+            self.resolved = 0
 
 
 IpOrOptionsType = Union[str, ConnectionOptions]
 
 
 async def process_ip_or_options(ip_or_options: IpOrOptionsType) -> ConnectionOptions:
-    """Return ConnectionOptions class from ip str or ConnectionOptions."""
+    """Return ConnectionOptions class from ip str or ConnectionOptions.
+
+    A host name is resolved off the event loop and kept in host, so the
+    options can be resolved again once expired.
+    """
     if isinstance(ip_or_options, str):
         options = ConnectionOptions(ip_or_options)
     else:
         options = ip_or_options
 
-    try:
-        ipaddress.ip_address(options.ip_address)
-    except ValueError:
-        loop = asyncio.get_running_loop()
-        options.ip_address = await loop.run_in_executor(
-            None, gethostbyname, options.ip_address
+    if options.host is None:
+        try:
+            ipaddress.ip_address(options.ip_address)
+        except ValueError:
+            options.host = options.ip_address
+    if options.host is not None:
+        infos = await asyncio.wait_for(
+            asyncio.get_running_loop().getaddrinfo(
+                options.host, options.port, type=SOCK_STREAM
+            ),
+            SOCKET_TIMEOUT,
         )
+        # 4heat modules speak IPv4, prefer it over IPv6 addresses
+        info = next((info for info in infos if info[0] == AF_INET), infos[0])
+        options.ip_address = str(info[4][0])
+    options.resolved = monotonic()
 
     return options
 
@@ -91,7 +133,14 @@ class FourHeatDevice:
         self.host = host
         self.port = port
         self.mode = CONF_MODE[mode]
-        self.options: ConnectionOptions  # TO DO move all connection options here
+        # TO DO move all connection options here
+        self.options = ConnectionOptions(host, port, mode)
+        self._dns_refresh: asyncio.Task | None = None
+        self.persistent_session: bool = False
+        self._session: tuple[asyncio.StreamReader, asyncio.StreamWriter] | None = None
+        # None until known whether the firmware keeps connections open
+        self._session_supported: bool | None = None
+        self._session_closes: int = 0
         self.fourheat: dict[str, Any] | None = None  # TO DO get serial, model i.e
         # self.settings: dict[str, Any] | None = None  # TO DO move monitored conditions
         self._status: dict[str, Any] | None = None
@@ -101,7 +150,23 @@ class FourHeatDevice:
         self._initializing: bool = False
         self._last_error: FourHeatError | None = None
         self._command_is_running: list | None = None
-        # self._command_queue = queue.PriorityQueue()
+        self._buffer = bytearray(SOCKET_BUFFER)
+        self._command_queue: asyncio.PriorityQueue[
+            tuple[int, int, str, list, asyncio.Future]
+        ] = asyncio.PriorityQueue()
+        self._command_counter = count()
+        self._command_worker: asyncio.Task | None = None
+        self.breaker = CircuitBreaker(name)
+        self.statistics = DeviceStatistics()
+        self.trace = ProtocolTrace()
+        self.watchdog = StallWatchdog(name, self.statistics)
+        self.connection = get_host_connection(host)
+        # cheap request checking whether a failing device is back
+        self._probe_query = self.commands[GET_COMMAND] + [
+            f"I{DEVICE_STATE_SENSOR}{str(0).zfill(12)}"
+        ]
+        self._pending_reads: dict[str, asyncio.Future[FourHeatRecord]] = {}
+        self._reads_flush: asyncio.Task | None = None
 
         # self.cfgChanged
 
@@ -121,6 +186,16 @@ class FourHeatDevice:
             return instance
         return instance
 
+    async def async_restore(self, sensors: dict[str, dict]) -> None:
+        """Initialize from a stored sensor catalog without asking the device."""
+        await self.update_fourheat()
+        self.sensors = {
+            attr: {"sensor_type": sensor["sensor_type"], "value": sensor["value"]}
+            for attr, sensor in sensors.items()
+        }
+        self.initialized = True
+        self._status = getattr(self, DEVICE_STATE_SENSOR, None)
+
     async def initialize(self, async_init: bool = False) -> None:
         """Initialize connection and check which sensors are supported."""
         if self._initializing:
@@ -143,13 +218,13 @@ class FourHeatDevice:
                     for item in sensors:
                         LOGGER.debug(
                             "sensor: %s, type: %s, value: %s",
-                            item["id"],
-                            item["sensor_type"],
-                            item["value"],
+                            item.id,
+                            item.sensor_type,
+                            item.value,
                         )
-                        self.sensors[item["id"]] = {
-                            "sensor_type": item["sensor_type"],
-                            "value": item["value"],
+                        self.sensors[item.id] = {
+                            "sensor_type": item.sensor_type,
+                            "value": item.value,
                         }
                     self.initialized = True
                 else:
@@ -164,108 +239,377 @@ class FourHeatDevice:
         finally:
             self._initializing = False
 
-    async def async_update_data(self) -> None:
-        """Fetch new data from 4heat."""
+    async def async_update_data(self, attrs: Iterable[str] | None = None) -> set[str]:
+        """Fetch new data from 4heat.
+
+        Without attrs all sensors are fetched with one SEL sweep, which also
+        discovers sensors not known yet. With attrs only those are read with
+        GET frames, nothing is read if the device has none of them.
+        Returns ids of sensors whose type or value changed or which are new.
+        """
+        if attrs is not None:
+            attrs = [attr for attr in attrs if attr in self.sensors]
+            if not attrs:
+                return set()
+        before = {
+            attr: (sensor["sensor_type"], sensor["value"])
+            for attr, sensor in self.sensors.items()
+        }
         try:
-            LOGGER.debug(
-                "Fetching new data from device %s:%s",
-                self.host,
-                self.port,
-            )
-            result = await self.async_send_command("info")
-            LOGGER.debug("4heat data received:%s", result)
-            # TO DO how is the auto add boolean working in HASS
-            if result:
-                for item in result:
-                    if item["id"] not in self.sensors:
-                        # add missing sensor
-                        self.sensors[item["id"]] = {
-                            "sensor_type": item["sensor_type"],
-                            "value": item["value"],
-                        }
-                    else:
-                        self.sensors[item["id"]].update(item)
-                LOGGER.debug("Updated sensors: %s", self.sensors)
+            if attrs is not None:
+                LOGGER.debug(
+                    "Fetching %s sensors from device %s:%s",
+                    len(attrs),
+                    self.host,
+                    self.port,
+                )
+                await self.async_get_states(attrs)
             else:
-                raise CommandError("Update got None result! Inform maintainer!")
+                await self._async_update_all()
         except CommandError as err:
             LOGGER.debug("4heat data update failed with:%s", str(err))
             raise FourHeatError from self._last_error
+        return {
+            attr
+            for attr, sensor in self.sensors.items()
+            if before.get(attr) != (sensor["sensor_type"], sensor["value"])
+        }
 
-    async def _send_and_receive(self, query: list) -> tuple[str, list[dict]]:
+    async def _async_update_all(self) -> None:
+        """Fetch all sensors with a SEL sweep."""
+        LOGGER.debug(
+            "Fetching new data from device %s:%s",
+            self.host,
+            self.port,
+        )
+        result = await self.async_send_command("info")
+        LOGGER.debug("4heat data received:%s", result)
+        # TO DO how is the auto add boolean working in HASS
+        if not result:
+            raise CommandError("Update got None result! Inform maintainer!")
+        for item in result:
+            if item.id not in self.sensors:
+                # add missing sensor
+                self.sensors[item.id] = {
+                    "sensor_type": item.sensor_type,
+                    "value": item.value,
+                }
+            else:
+                self.sensors[item.id].update(
+                    sensor_type=item.sensor_type, value=item.value
+                )
+        LOGGER.debug("Updated sensors: %s", self.sensors)
+
+    async def _send_and_receive(
+        self, command: str, query: list
+    ) -> tuple[str, list[FourHeatRecord]]:
         """Communication with 4heat device.
 
         Returns tuple (
             result : TYPE str,
-            sensors: dict{
+            sensors: list[FourHeatRecord(
                 id : unique_id
                 sensor_type: type B or J
                 value: int
-            )
+            )]
+        )
         """
 
-        while bool(self._command_is_running):
-            await asyncio.sleep(1)
-            LOGGER.debug(
-                "Waiting previous command %s to finish... ",
-                self._command_is_running,
-            )
+        stats = self.statistics.command(command)
+        stats.count += 1
         try:
-            self._command_is_running = query
-            soc = socket(AF_INET, SOCK_STREAM)
-            soc.settimeout(SOCKET_TIMEOUT)
-            soc.connect((self.host, self.port))
-            # 4heat insists on double quotes..... Single quotes give empty answer
-            msg = bytes("[" + ", ".join(f'"{item}"' for item in query) + "]", "utf-8")
-            LOGGER.debug("Sending message: %s", msg)
-            soc.send(msg)
-            result = soc.recv(SOCKET_BUFFER).decode()
-            LOGGER.debug("Result received: %s", result)
-            soc.close()
-            if result:
-                try:
-                    result = literal_eval(result)
-                    sensors = []
-                    for sensor in result[2:]:
-                        if len(sensor) > 6:
-                            sensors.append(
-                                {
-                                    "id": sensor[1:6],
-                                    "sensor_type": sensor[0],
-                                    "value": int(sensor[7:]),
-                                }
-                            )
-                    self._last_error = None
-                    self._command_is_running = None
-                    return (result[0], sensors)
-                except SyntaxError as error:
-                    self._last_error = DeviceConnectionError(
-                        f"Got malformed answer from device - {str(error)}"
-                    )
-            self._last_error = DeviceConnectionError("Got empty answer")
-        except OSError as err:
+            msg = build_frame(query)
+            async with self.connection.async_exchange():
+                frame = await self._async_exchange(command, msg, stats)
+            if not frame:
+                self.statistics.empty_replies += 1
+                raise DeviceConnectionError("Got empty answer")
+            try:
+                self.watchdog.phase(command, "parse")
+                parse_started = monotonic()
+                (result, sensors) = parse_frame(frame)
+                stats.parse.record(monotonic() - parse_started)
+            except InvalidMessage as error:
+                self.statistics.malformed_replies += 1
+                raise DeviceConnectionError(
+                    f"Got malformed answer from device - {str(error)}"
+                ) from error
+            self.connection.record(len(msg), len(frame))
+            self._last_error = None
+            return (result, sensors)
+        except DeviceConnectionError as err:
+            self._close_session()
+            self._last_error = err
+        except (OSError, asyncio.TimeoutError) as err:
+            self._close_session()
+            # the device may have got a new address
+            self.options.invalidate()
             self._last_error = DeviceConnectionError(
                 f"Unsuccessful communication with {self.host}:{self.port} - {str(err)}"
             )
+        finally:
+            self.watchdog.done()
+        self.connection.record_failure()
+        self.trace.record("error", str(self._last_error).encode())
         LOGGER.debug(
             "On running: %s, got last_error: %s",
-            self._command_is_running,
+            query,
             self._last_error,
         )
-
-        asyncio.create_task(self._i_am_lazy())  # give the lazy module 5 sec to recover
         raise DeviceConnectionError from self._last_error
 
-    async def _i_am_lazy(self) -> None:
+    async def _async_exchange(
+        self, command: str, msg: bytes, stats: CommandStatistics
+    ) -> bytes:
+        """Send a frame and read the answer.
+
+        With persistent_session the connection is kept for the following
+        frames. A kept connection the device has closed or stopped answering
+        on is replaced by a new one. If the firmware never serves a second
+        frame, connect per request is used again.
+        """
+        started = monotonic()
+        if self._session is not None:
+            (reader, writer) = self._session
+            self._session = None
+            if self.persistent_session and not (reader.at_eof() or writer.is_closing()):
+                frame = b""
+                try:
+                    frame = await self._async_talk(
+                        command, msg, stats, started, reader, writer
+                    )
+                except (OSError, asyncio.TimeoutError):
+                    pass
+                finally:
+                    # any other error or cancellation must not leak the writer
+                    if not frame:
+                        writer.close()
+                if frame:
+                    self._session_supported = True
+                    self._session_closes = 0
+                    self.statistics.reused_connections += 1
+                    self._session = (reader, writer)
+                    return frame
+            writer.close()
+            if self.persistent_session:
+                self._session_lost()
+            started = monotonic()
+
+        host = await self._async_resolve(command)
+        self.watchdog.phase(command, "connect")
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, self.port), SOCKET_TIMEOUT
+        )
+        stats.connect.record(monotonic() - started)
+        self.statistics.connections += 1
+        frame = b""
+        try:
+            frame = await self._async_talk(command, msg, stats, started, reader, writer)
+        finally:
+            if (
+                frame
+                and self.persistent_session
+                and self._session_supported is not False
+            ):
+                self._session = (reader, writer)
+            else:
+                writer.close()
+                with suppress(OSError):
+                    await writer.wait_closed()
+        return frame
+
+    async def _async_talk(
+        self,
+        command: str,
+        msg: bytes,
+        stats: CommandStatistics,
+        started: float,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> bytes:
+        """Write a frame to a connection and read the answer."""
+        LOGGER.debug("Sending message: %s", msg)
+        writer.write(msg)
+        self.trace.record("tx", msg, monotonic() - started)
+        self.statistics.bytes_sent += len(msg)
+        self.watchdog.phase(command, "recv")
+        await asyncio.wait_for(writer.drain(), SOCKET_TIMEOUT)
+        frame = await self._read_frame(reader, stats, started)
+        stats.frame.record(monotonic() - started)
+        self.trace.record("rx", frame, monotonic() - started)
+        self.statistics.bytes_received += len(frame)
+        LOGGER.debug("Result received: %s", frame)
+        return frame
+
+    def _session_lost(self) -> None:
+        """Count a lost kept connection, give up sessions if none ever worked."""
+        self._session_closes += 1
+        if (
+            self._session_supported is None
+            and self._session_closes >= SESSION_FALLBACK_CLOSES
+        ):
+            LOGGER.info(
+                "%s closes every connection, falling back to connect per request",
+                self.name,
+            )
+            self._session_supported = False
+
+    def _close_session(self) -> None:
+        """Close the kept connection."""
+        if self._session is not None:
+            self._session[1].close()
+            self._session = None
+
+    async def _async_resolve(self, command: str) -> str:
+        """Return the cached ip address of the device.
+
+        Resolves on first use and after connection failures, expired
+        addresses are refreshed in the background while still being used.
+        """
+        options = self.options
+        if not options.resolved:
+            self.watchdog.phase(command, "dns")
+            await process_ip_or_options(options)
+        elif options.expired and self._dns_refresh is None:
+            self._dns_refresh = asyncio.create_task(self._async_refresh_address())
+        return options.ip_address
+
+    async def _async_refresh_address(self) -> None:
+        """Resolve the host name again, keep the old address on failure."""
+        try:
+            await process_ip_or_options(self.options)
+        except (OSError, asyncio.TimeoutError) as err:
+            LOGGER.debug("Resolving %s failed: %s", self.options.host, err)
+        finally:
+            self._dns_refresh = None
+
+    async def _async_queue_query(
+        self, command: str, query: list, priority: int
+    ) -> tuple[str, list[FourHeatRecord]]:
+        """Queue query for the command worker and wait for its answer."""
+        future: asyncio.Future[
+            tuple[str, list[FourHeatRecord]]
+        ] = asyncio.get_running_loop().create_future()
+        self._command_queue.put_nowait(
+            (priority, next(self._command_counter), command, query, future)
+        )
+        if self._command_worker is None or self._command_worker.done():
+            self._command_worker = asyncio.create_task(self._async_command_worker())
+        return await future
+
+    async def _async_command_worker(self) -> None:
+        """Send queued queries one at a time, most urgent first."""
+        while True:
+            try:
+                (_, _, command, query, future) = await asyncio.wait_for(
+                    self._command_queue.get(), COMMAND_WORKER_IDLE
+                )
+            except asyncio.TimeoutError:
+                # a query may have been queued while get() was cancelled
+                if self._command_queue.empty():
+                    return
+                continue
+            if future.done():
+                # caller is not waiting anymore
+                continue
+            if not self.breaker.allow_request():
+                future.set_exception(
+                    CircuitOpenError(
+                        f"Device {self.name} is not answering, next try in "
+                        f"{self.breaker.retry_in:.0f} seconds"
+                    )
+                )
+                continue
+            self._command_is_running = query
+            try:
+                if self.breaker.state == BREAKER_HALF_OPEN:
+                    await self._send_and_receive("probe", self._probe_query)
+                    self.breaker.record_success()
+                result = await self._send_and_receive(command, query)
+            except asyncio.CancelledError:
+                # shutting down, the caller must not wait forever
+                if not future.done():
+                    future.set_exception(NotInitialized("Device is shutting down"))
+                raise
+            except DeviceConnectionError as err:
+                delay = self.breaker.record_failure()
+                # the caller may have been cancelled while the frame was sent
+                if not future.done():
+                    future.set_exception(err)
+                # give the lazy module some time to recover
+                await self._i_am_lazy(delay)
+            else:
+                self.breaker.record_success()
+                if not future.done():
+                    future.set_result(result)
+            finally:
+                self._command_is_running = None
+
+    async def async_shutdown(self) -> None:
+        """Stop the command worker and fail queued commands."""
+        if self._reads_flush is not None:
+            self._reads_flush.cancel()
+            self._reads_flush = None
+        for future in self._pending_reads.values():
+            future.cancel()
+        self._pending_reads = {}
+        self.watchdog.cancel()
+        self._close_session()
+        if self._dns_refresh is not None:
+            self._dns_refresh.cancel()
+            self._dns_refresh = None
+        if self._command_worker is not None:
+            self._command_worker.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._command_worker
+            self._command_worker = None
+        while not self._command_queue.empty():
+            (_, _, _, _, future) = self._command_queue.get_nowait()
+            if not future.done():
+                future.set_exception(NotInitialized("Device is shutting down"))
+
+    async def _read_frame(
+        self, reader: asyncio.StreamReader, stats: CommandStatistics, started: float
+    ) -> bytes:
+        """Read one reply frame.
+
+        Replies may be longer than SOCKET_BUFFER or come in several TCP
+        segments, so chunks are collected in the device buffer until the
+        closing bracket of the array or the end of the stream.
+        """
+        size = 0
+        while True:
+            chunk = await asyncio.wait_for(reader.read(SOCKET_BUFFER), SOCKET_TIMEOUT)
+            if not chunk:
+                break
+            if not size:
+                stats.first_byte.record(monotonic() - started)
+            end = size + len(chunk)
+            if end > MAX_FRAME_SIZE:
+                raise DeviceConnectionError(
+                    f"Answer exceeds maximum frame size of {MAX_FRAME_SIZE} bytes"
+                )
+            if end > len(self._buffer):
+                # grow and keep the larger buffer for the following frames
+                grow_to = min(max(end, 2 * len(self._buffer)), MAX_FRAME_SIZE)
+                self._buffer.extend(bytes(grow_to - len(self._buffer)))
+            self._buffer[size:end] = chunk
+            size = end
+            if b"]" in chunk:
+                break
+        return bytes(self._buffer[:size])
+
+    async def _i_am_lazy(self, delay: float) -> None:
         """4heat module is constatly rebooting or getting disconnected under load (and not only then....)."""
-        LOGGER.debug("Blocking following commands for %s seconds", RETRY_UPDATE_SLEEP)
-        await asyncio.sleep(RETRY_UPDATE_SLEEP)
-        self._command_is_running = None
-        return
+        if not delay:
+            return
+        LOGGER.debug("Blocking following commands for %.1f seconds", delay)
+        self.statistics.lazy_waits += 1
+        await asyncio.sleep(delay)
 
     async def async_send_command(
         self, command: str, arg: list | None = None, retry: bool = True
-    ) -> list[dict] | None:
+    ) -> list[FourHeatRecord] | None:
         """Send command."""
         LOGGER.debug(
             "Sending command %s%s",
@@ -278,23 +622,42 @@ class FourHeatDevice:
                 break
             try:
                 await self.initialize()
-            except NotInitialized:
+            except NotInitialized as err:
                 LOGGER.debug("Can't initialize %s - %s", self.name, self._last_error)
+                if self.breaker.is_open:
+                    # don't spin until the breaker lets requests pass again
+                    self.statistics.command(command).failures += 1
+                    raise CommandError(
+                        f"Unsuccessful execution of command {command} - device "
+                        f"{self.name} is not answering, next try in "
+                        f"{self.breaker.retry_in:.0f} seconds"
+                    ) from err
         if command in self.commands:
             if arg:
                 query = self.commands[command] + arg
             else:
                 query = self.commands[command]
+            priority = COMMAND_PRIORITIES.get(command, COMMAND_PRIORITIES[INFO_COMMAND])
             retries = RETRY_UPDATE if retry else 1
             retry_step = 1
             while retry_step <= retries:
                 try:
                     LOGGER.debug("Try: %s from %s", retry_step, retries)
-                    (result, sensors) = await self._send_and_receive(query)
+                    (result, sensors) = await self._async_queue_query(
+                        command, query, priority
+                    )
                     break
+                except CircuitOpenError as err:
+                    self.statistics.command(command).failures += 1
+                    raise CommandError(
+                        f"Unsuccessful execution of command {command} - {str(err)}"
+                    ) from err
                 except DeviceConnectionError:
                     retry_step += 1
+                    if retry_step <= retries:
+                        self.statistics.command(command).retries += 1
             else:
+                self.statistics.command(command).failures += 1
                 raise CommandError(
                     f"Unsuccessful execution of command {command} - {str(self._last_error)}"
                 ) from self._last_error
@@ -323,20 +686,15 @@ class FourHeatDevice:
                         sensors,
                     )
                     return sensors
-                if (
-                    command == SET_COMMAND
-                    and sensors[0]["id"] == query[2][1:6]
-                    and sensors[0]["value"] == int(query[2][7:])
-                    and sensors[0]["sensor_type"] == "A"
-                ):
+                if command == SET_COMMAND and self._acknowledged(query[2:], sensors):
                     LOGGER.debug("Command '%s' successfully executed", command)
                     return None
 
                 if (
                     command in [ON_COMMAND, OFF_COMMAND, UNBLOCK_COMMAND]
-                    and sensors[0]["id"] == query[2][1:6]
-                    and sensors[0]["value"] == 0
-                    and sensors[0]["sensor_type"] == "I"
+                    and sensors[0].id == query[2][1:6]
+                    and sensors[0].value == 0
+                    and sensors[0].sensor_type == "I"
                 ):
                     LOGGER.debug("Command %s successfully executed", command)
                     return None
@@ -358,49 +716,125 @@ class FourHeatDevice:
 
     async def async_set_state(self, attr: str, value: StateType) -> bool:
         """Set 4heat device attribute."""
+        await self.async_set_states({attr: value})
+        return True
+
+    async def async_set_states(self, values: Mapping[str, StateType]) -> None:
+        """Set 4heat device attributes.
+
+        All values are checked before anything is sent, then written with
+        up to SET_MAX_RECORDS records per SET frame. Every record must be
+        acknowledged by the device.
+        """
+        records = []
+        for attr, value in values.items():
+            if attr not in self.sensors:
+                raise AttributeError(f"Device doesn't have such attribute {attr}")
+            if self.sensors[attr]["sensor_type"] == "J":
+                raise AttributeError("Attribute is read only")
+            if value is None:
+                raise AttributeError("Can't set value to None")
+            records.append(f"B{attr}{str(int(value)).zfill(12)}")
+        for start in range(0, len(records), SET_MAX_RECORDS):
+            chunk = records[start : start + SET_MAX_RECORDS]
+            try:
+                await self.async_send_command(SET_COMMAND, chunk)
+            except (CommandError, InvalidMessage, InvalidCommand) as err:
+                raise FourHeatError(
+                    f"Exception on setting value of {', '.join(record[1:6] for record in chunk)} - {str(err)}"
+                ) from err
+            for record in chunk:
+                self.sensors[record[1:6]]["value"] = values[record[1:6]]
+
+    @staticmethod
+    def _acknowledged(query: list[str], sensors: list[FourHeatRecord]) -> bool:
+        """Return True if every written record got its acknowledgement."""
+        acks = {
+            sensor.id: sensor.value for sensor in sensors if sensor.sensor_type == "A"
+        }
+        return all(acks.get(record[1:6]) == int(record[7:]) for record in query)
+
+    async def async_get_state(self, attr: str) -> FourHeatRecord:
+        """Get state of a 4heat device attribute."""
+        return (await self.async_get_states([attr]))[attr]
+
+    async def async_get_states(self, attrs: Iterable[str]) -> dict[str, FourHeatRecord]:
+        """Get states of 4heat device attributes.
 
-        if attr not in self.sensors:
-            raise AttributeError(f"Device doesn't have such attribute {attr}")
-        if self.sensors[attr]["sensor_type"] == "J":
-            raise AttributeError("Attribute is read only")
-        if not value:
-            raise AttributeError("Can't set value to None")
-        arg = [f"B{attr}{str(int(value)).zfill(12)}"]
+        Reads requested within GET_COALESCE_WINDOW are merged into one GET
+        frame (or a few if more than GET_MAX_RECORDS) and the answer is
+        shared between all callers.
+        """
+        loop = asyncio.get_running_loop()
+        futures: dict[str, asyncio.Future[FourHeatRecord]] = {}
+        for attr in attrs:
+            if (future := self._pending_reads.get(attr)) is None:
+                future = self._pending_reads[attr] = loop.create_future()
+            futures[attr] = future
+        if self._reads_flush is None:
+            self._reads_flush = asyncio.create_task(self._async_flush_reads())
+        # shield, so a cancelled caller doesn't cancel the read for the others
+        records = await asyncio.gather(
+            *(asyncio.shield(future) for future in futures.values()),
+            return_exceptions=True,
+        )
+        for record in records:
+            if isinstance(record, BaseException):
+                raise record
+        return dict(zip(futures, cast(list[FourHeatRecord], records)))
+
+    async def _async_flush_reads(self) -> None:
+        """Send collected reads as multi-record GET frames."""
+        await asyncio.sleep(GET_COALESCE_WINDOW)
+        self._reads_flush = None
+        pending, self._pending_reads = self._pending_reads, {}
+        attrs = list(pending)
+        LOGGER.debug("Reading %s attributes in one go: %s", len(attrs), attrs)
+        error: Exception | None = None
         try:
-            await self.async_send_command("set", arg)
-            self.sensors[attr]["value"] = value
-            return True
-        except (CommandError, InvalidMessage, InvalidCommand) as err:
-            raise FourHeatError(
-                f"Exception on setting value of {attr} - {str(err)}"
-            ) from err
-
-    # async def async_get_state(self, attr: str | list) -> None:  # dict[str, str | list]:
-    #     """Getting state of a 4heat device attribute."""
-
-    #     # if isinstance(attr, str) and attr not in self.sensors:
-    #     #     raise AttributeError(f"Device doesn't have such attribute {attr}")
-    #     # if not all(item in self.sensors for item in attr):
-    #     #     raise AttributeError("Device doesn't have one of the attributes asked")
-    #     arg = []
-    #     if isinstance(attr, list):
-    #         for item in attr:
-    #             if item not in self.sensors:
-    #                 raise AttributeError(f"Device doesn't have such attribute {item}")
-    #             arg.append([f"I{item}{str(0).zfill(12)}"])
-    #     else:
-    #         if attr not in self.sensors:
-    #             raise AttributeError(f"Device doesn't have such attribute {attr}")
-    #         arg.append([f"I{attr}{str(0).zfill(12)}"])
-    #     try:
-    #         sensors = await self.async_send_command("get", arg)
-    #         for sensor in sensors:
-    #             self.sensors[sensor["id"]]["value"] = sensor["value"]
-    #             self.sensors[sensor["id"]]["sensor_type"] = sensor["sensor_type"]
-    #     except (CommandError, InvalidMessage, InvalidCommand) as err:
-    #         raise FourHeatError(
-    #             f"Exception on getting value of {attr} - {str(err)}"
-    #         ) from err
+            for start in range(0, len(attrs), GET_MAX_RECORDS):
+                chunk = attrs[start : start + GET_MAX_RECORDS]
+                try:
+                    result = await self.async_send_command(
+                        GET_COMMAND, [f"I{attr}{str(0).zfill(12)}" for attr in chunk]
+                    )
+                except FourHeatError as err:
+                    for attr in chunk:
+                        if not pending[attr].done():
+                            pending[attr].set_exception(err)
+                            # callers may be gone already, don't warn about it
+                            pending[attr].exception()
+                    continue
+                records = {record.id: record for record in result or []}
+                for attr in chunk:
+                    if (record := records.get(attr)) is not None:
+                        if attr in self.sensors:
+                            self.sensors[attr]["value"] = record.value
+                        else:
+                            self.sensors[attr] = {
+                                "sensor_type": record.sensor_type,
+                                "value": record.value,
+                            }
+                    if pending[attr].done():
+                        continue
+                    if record is None:
+                        pending[attr].set_exception(
+                            InvalidMessage(f"Device didn't return attribute {attr}")
+                        )
+                        pending[attr].exception()
+                    else:
+                        pending[attr].set_result(record)
+        except Exception as err:  # pylint: disable=broad-except
+            # raised to the callers below
+            error = err
+        finally:
+            # callers wait shielded, never leave them pending
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(
+                        error or CommandError("Reading attributes was cancelled")
+                    )
+                    future.exception()
 
     def info(self, attr: str) -> dict[str, Any] | None:
         """Return info over attribute."""
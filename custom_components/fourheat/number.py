@@ -77,3 +77,4 @@ class FourHeatNumber(FourHeatAttributeEntity, NumberEntity):
             self.unique_id.split("-")[-1], int(value)
         )
         self.async_write_ha_state()
+        self.coordinator.async_schedule_read_back([self.attribute])
@@ -0,0 +1,66 @@
+"""Parser for the 4heat wire protocol.
+
+A 4heat frame is a JSON-like array of double quoted fields:
+
+    ["SEL","3","J30001000000000005","J30017000000000055","B20180000000000070"]
+
+The first field is the result ("SEL", "SEC", "ERR"), the second one the
+number of records and every following field a record made of the record
+type (J, B, I, A), the five digit sensor id and the value.
+"""
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from .exceptions import InvalidMessage
+
+_WHITESPACE = b" \t\r\n"
+
+
+class FourHeatRecord(NamedTuple):
+    """Single sensor record of a 4heat frame."""
+
+    id: str
+    sensor_type: str
+    value: int
+
+
+# tuple.__new__ skips the argument handling of the generated NamedTuple.__new__
+_new_record = tuple.__new__
+
+
+def parse_frame(frame: bytes) -> tuple[str, list[FourHeatRecord]]:
+    """Parse a raw 4heat frame.
+
+    Returns tuple (result, records). Records shorter than the id are skipped
+    as the device uses them for acknowledgements without value, a missing
+    record count is accepted (some modules answer a bare ["ERR"]).
+    Raises InvalidMessage pointing to the offending field on malformed input.
+    """
+    try:
+        text = frame.translate(None, _WHITESPACE).decode("ascii")
+    except UnicodeDecodeError as err:
+        raise InvalidMessage(f"Frame is not ASCII: {frame[:40]!r}") from err
+    if not text.startswith('["') or not text.endswith('"]'):
+        raise InvalidMessage(f"Frame is not a quoted array: {frame[:40]!r}")
+    fields = text[2:-2].split('","')
+    if '"' in fields[0]:
+        raise InvalidMessage(f"Malformed result field: {fields[0]!r}")
+
+    records: list[FourHeatRecord] = []
+    append = records.append
+    for field in fields[2:]:
+        if len(field) <= 6:
+            continue
+        sensor_id = field[1:6]
+        value = field[7:]
+        if not (sensor_id.isdigit() and value.isdigit()):
+            raise InvalidMessage(f"Malformed record: {field!r}")
+        append(_new_record(FourHeatRecord, (sensor_id, field[0], int(value))))
+    return (fields[0], records)
+
+
+def build_frame(query: list[str]) -> bytes:
+    """Build a frame from query fields."""
+    # 4heat insists on double quotes..... Single quotes give empty answer
+    return bytes("[" + ", ".join(f'"{item}"' for item in query) + "]", "utf-8")
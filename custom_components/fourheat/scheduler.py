@@ -0,0 +1,109 @@
+"""Polling schedules for 4heat devices."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from time import monotonic
+
+from .const import (
+    POLL_TIER_BY_CLASS,
+    POLL_TIER_DEFAULT,
+    POLL_TIERS,
+    SCHEDULE_SLACK,
+    SENSOR_POLL_TIERS,
+)
+
+
+def get_poll_tier(attr: str) -> str:
+    """Return the refresh tier of a sensor."""
+    if (tier := SENSOR_POLL_TIERS.get(attr)) is not None:
+        return tier
+    return POLL_TIER_BY_CLASS.get(attr[:1], POLL_TIER_DEFAULT)
+
+
+class SensorPollScheduler:
+    """Track when each sensor was read and which ones are due."""
+
+    def __init__(self) -> None:
+        """Initialize the scheduler."""
+        self._last_polled: dict[str, float] = {}
+        self._intervals: dict[str, int] = {}
+
+    def interval(self, attr: str) -> int:
+        """Refresh interval of a sensor in seconds."""
+        if (interval := self._intervals.get(attr)) is None:
+            interval = self._intervals[attr] = POLL_TIERS[get_poll_tier(attr)]
+        return interval
+
+    def due(self, attrs: Iterable[str], now: float | None = None) -> list[str]:
+        """Return sensors whose refresh interval has elapsed."""
+        if now is None:
+            now = monotonic()
+        last_polled = self._last_polled
+        return [
+            attr
+            for attr in attrs
+            if attr not in last_polled
+            or now - last_polled[attr] >= self.interval(attr) - SCHEDULE_SLACK
+        ]
+
+    def mark_polled(self, attrs: Iterable[str], now: float | None = None) -> None:
+        """Remember sensors as read."""
+        if now is None:
+            now = monotonic()
+        for attr in attrs:
+            self._last_polled[attr] = now
+
+
+class FleetPollScheduler:
+    """Spread the polls of all 4heat devices evenly over their interval.
+
+    Every device gets a phase, its position among the devices divided by
+    their number. Polls are moved up to the last point in time before they
+    are due where the poll clock (time modulo interval) matches the phase, so
+    devices with the same interval take turns instead of polling at the same
+    instant.
+    Phases are reassigned when devices are added or removed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the scheduler."""
+        self._members: list[str] = []
+        self._phases: dict[str, float] = {}
+
+    def add(self, member: str) -> None:
+        """Add a device to the fleet."""
+        if member not in self._members:
+            self._members.append(member)
+            self._assign_phases()
+
+    def remove(self, member: str) -> None:
+        """Remove a device from the fleet."""
+        if member in self._members:
+            self._members.remove(member)
+            self._assign_phases()
+
+    def _assign_phases(self) -> None:
+        """Spread the phases of all members evenly."""
+        count = len(self._members)
+        self._phases = {
+            member: index / count for index, member in enumerate(self._members)
+        }
+
+    def phase(self, member: str) -> float | None:
+        """Return the phase of a device as a share of its interval."""
+        return self._phases.get(member)
+
+    def next_poll(self, member: str, interval: float, now: float) -> float:
+        """Return the timestamp of the next poll of a device.
+
+        A poll is only ever moved earlier, never later than interval from
+        now, and a device polling alone is not moved at all.
+        """
+        target = now + interval
+        if (
+            (phase := self._phases.get(member)) is None
+            or len(self._members) < 2
+            or interval <= 0
+        ):
+            return target
+        return target - (target - phase * interval) % interval
@@ -1,23 +1,33 @@
 """The 4Heat integration sensor."""
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
 
-from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
+from homeassistant.components.sensor import (
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfInformation, UnitOfTime
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
 
 from .const import LOGGER
-from .coordinator import FourHeatCoordinator
+from .coordinator import FourHeatCoordinator, get_entry_data
 from .entity import (
     FourHeatAttributeEntity,
+    FourHeatEntity,
     FourHeatEntityDescription,
     _setup_descriptions,
     async_setup_entry_attribute_entities,
 )
 from .fourheat import FourHeatDevice
+from .stats import DeviceStatistics
+from .utils import get_device_entity_name
 
 
 @dataclass
@@ -25,13 +35,66 @@ class FourHeatSensorDescription(FourHeatEntityDescription, SensorEntityDescripti
     """Class to describe a device sensor."""
 
 
+@dataclass
+class FourHeatStatisticDescription(SensorEntityDescription):
+    """Class to describe a communication statistic sensor."""
+
+    value: Callable[[DeviceStatistics], StateType] = lambda _: None
+    entity_category: EntityCategory | None = EntityCategory.DIAGNOSTIC
+    entity_registry_enabled_default: bool = False
+
+
+STATISTIC_SENSORS = (
+    FourHeatStatisticDescription(
+        key="stats_latency",
+        name="Command latency",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value=lambda stats: None
+        if stats.mean_latency is None
+        else round(stats.mean_latency, 1),
+    ),
+    FourHeatStatisticDescription(
+        key="stats_retries",
+        name="Command retries",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value=lambda stats: stats.retries,
+    ),
+    FourHeatStatisticDescription(
+        key="stats_failures",
+        name="Failed commands",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value=lambda stats: stats.failures,
+    ),
+    FourHeatStatisticDescription(
+        key="stats_bad_replies",
+        name="Malformed replies",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value=lambda stats: stats.malformed_replies + stats.empty_replies,
+    ),
+    FourHeatStatisticDescription(
+        key="stats_received",
+        name="Bytes received",
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value=lambda stats: stats.bytes_received,
+    ),
+    FourHeatStatisticDescription(
+        key="stats_stalls",
+        name="Event loop stalls",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value=lambda stats: sum(stats.stalls.values()),
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up sensors for device."""
-    return async_setup_entry_attribute_entities(
+    async_setup_entry_attribute_entities(
         hass,
         config_entry,
         async_add_entities,
@@ -41,6 +104,12 @@ async def async_setup_entry(
         ),
         FourHeatSensor,
     )
+    coordinator = get_entry_data(hass)[config_entry.entry_id].coordinator
+    assert coordinator
+    async_add_entities(
+        FourHeatStatisticSensor(coordinator, coordinator.device, description)
+        for description in STATISTIC_SENSORS
+    )
 
 
 class FourHeatSensor(FourHeatAttributeEntity, SensorEntity):
@@ -67,3 +136,32 @@ class FourHeatSensor(FourHeatAttributeEntity, SensorEntity):
     def native_value(self) -> StateType:
         """Return value of sensor."""
         return self.attribute_value
+
+
+class FourHeatStatisticSensor(FourHeatEntity, SensorEntity):
+    """Representation of a 4Heat communication statistic."""
+
+    entity_description: FourHeatStatisticDescription
+
+    def __init__(
+        self,
+        coordinator: FourHeatCoordinator,
+        device: FourHeatDevice,
+        description: FourHeatStatisticDescription,
+    ) -> None:
+        """Initialize sensor."""
+
+        super().__init__(coordinator, device)
+        self.entity_description = description
+        self._attr_unique_id = f"{super().unique_id}-{description.key}"
+        self._attr_name = get_device_entity_name(coordinator, description.name)
+
+    @property
+    def available(self) -> bool:
+        """Statistics are available also when the device is not."""
+        return True
+
+    @property
+    def native_value(self) -> StateType:
+        """Return value of sensor."""
+        return self.entity_description.value(self.device.statistics)
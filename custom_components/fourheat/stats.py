@@ -0,0 +1,206 @@
+"""Communication statistics of 4heat devices."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Any
+
+from .const import LATENCY_BUCKETS, TRACE_BUFFER_SIZE, TRACE_FRAME_SIZE
+
+
+class LatencyHistogram:
+    """Latency histogram with fixed buckets, constant in size."""
+
+    def __init__(self) -> None:
+        """Initialize the histogram."""
+        self.counts: list[int] = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count: int = 0
+        self.total: float = 0
+        self.max: float = 0
+
+    def record(self, seconds: float) -> None:
+        """Add a sample."""
+        millis = seconds * 1000
+        self.counts[bisect_left(LATENCY_BUCKETS, millis)] += 1
+        self.count += 1
+        self.total += millis
+        self.max = max(self.max, millis)
+
+    @property
+    def mean(self) -> float | None:
+        """Mean latency in milliseconds."""
+        if not self.count:
+            return None
+        return self.total / self.count
+
+    def percentile(self, percent: float) -> float | None:
+        """Upper bound in milliseconds of the bucket holding the percentile."""
+        if not self.count:
+            return None
+        rank = self.count * percent / 100
+        seen = 0
+        for bucket, count in zip(LATENCY_BUCKETS, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(float(bucket), self.max)
+        return self.max
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram as a dictionary."""
+        return {
+            "count": self.count,
+            "mean_ms": self.mean,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "max_ms": self.max,
+            "buckets_ms": dict(
+                zip([*map(str, LATENCY_BUCKETS), "inf"], self.counts, strict=True)
+            ),
+        }
+
+
+@dataclass
+class CommandStatistics:
+    """Statistics of a single command type."""
+
+    count: int = 0
+    failures: int = 0
+    retries: int = 0
+    connect: LatencyHistogram = field(default_factory=LatencyHistogram)
+    first_byte: LatencyHistogram = field(default_factory=LatencyHistogram)
+    frame: LatencyHistogram = field(default_factory=LatencyHistogram)
+    parse: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dictionary."""
+        return {
+            "count": self.count,
+            "failures": self.failures,
+            "retries": self.retries,
+            "connect": self.connect.as_dict(),
+            "first_byte": self.first_byte.as_dict(),
+            "frame": self.frame.as_dict(),
+            "parse": self.parse.as_dict(),
+        }
+
+
+@dataclass
+class DeviceStatistics:
+    """Communication statistics of a 4heat device."""
+
+    commands: dict[str, CommandStatistics] = field(default_factory=dict)
+    lazy_waits: int = 0
+    malformed_replies: int = 0
+    empty_replies: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    connections: int = 0
+    reused_connections: int = 0
+    stalls: dict[str, int] = field(default_factory=dict)
+    loop_lag: LatencyHistogram = field(default_factory=LatencyHistogram)
+    poll_jitter: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def command(self, command: str) -> CommandStatistics:
+        """Return statistics of a command type."""
+        if (stats := self.commands.get(command)) is None:
+            stats = self.commands[command] = CommandStatistics()
+        return stats
+
+    @property
+    def retries(self) -> int:
+        """Retries of all commands."""
+        return sum(stats.retries for stats in self.commands.values())
+
+    @property
+    def failures(self) -> int:
+        """Failed commands of all types."""
+        return sum(stats.failures for stats in self.commands.values())
+
+    @property
+    def mean_latency(self) -> float | None:
+        """Mean full frame latency of all commands in milliseconds."""
+        count = sum(stats.frame.count for stats in self.commands.values())
+        if not count:
+            return None
+        return sum(stats.frame.total for stats in self.commands.values()) / count
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dictionary."""
+        return {
+            "commands": {
+                command: stats.as_dict() for command, stats in self.commands.items()
+            },
+            "lazy_waits": self.lazy_waits,
+            "malformed_replies": self.malformed_replies,
+            "empty_replies": self.empty_replies,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "connections": self.connections,
+            "reused_connections": self.reused_connections,
+            "stalls": self.stalls,
+            "loop_lag": self.loop_lag.as_dict(),
+            "poll_jitter": self.poll_jitter.as_dict(),
+        }
+
+
+@dataclass
+class HostStatistics:
+    """Communication statistics of all devices behind one host."""
+
+    requests: int = 0
+    failures: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    waiting: LatencyHistogram = field(default_factory=LatencyHistogram)
+    started: float = field(default_factory=monotonic)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dictionary."""
+        minutes = max(monotonic() - self.started, 1) / 60
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "requests_per_minute": round(self.requests / minutes, 2),
+            "bytes_per_minute": round(
+                (self.bytes_sent + self.bytes_received) / minutes, 1
+            ),
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "waiting": self.waiting.as_dict(),
+        }
+
+
+class ProtocolTrace:
+    """Ring buffer of the last frames exchanged with a device.
+
+    Holds at most TRACE_BUFFER_SIZE entries of at most TRACE_FRAME_SIZE
+    bytes each, so memory stays fixed however long the device runs.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the trace."""
+        self._entries: deque[tuple[float, str, float, bytes]] = deque(
+            maxlen=TRACE_BUFFER_SIZE
+        )
+
+    def record(self, direction: str, frame: bytes, duration: float = 0) -> None:
+        """Add a frame, direction is "tx", "rx" or "error"."""
+        self._entries.append(
+            (monotonic(), direction, duration, frame[:TRACE_FRAME_SIZE])
+        )
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Return the trace, oldest frame first."""
+        now = monotonic()
+        return [
+            {
+                "timestamp": timestamp,
+                "age_s": round(now - timestamp, 3),
+                "direction": direction,
+                "duration_ms": round(duration * 1000, 1),
+                "frame": frame.decode("ascii", "replace"),
+            }
+            for (timestamp, direction, duration, frame) in self._entries
+        ]
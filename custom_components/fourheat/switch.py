@@ -80,6 +80,7 @@ class FourHeatSwitch(FourHeatAttributeEntity, SwitchEntity):
         await self.device.async_send_command(SERVICE_TURN_ON)
         self.control_result = STATE_ON
         self.async_write_ha_state()
+        self.coordinator.async_schedule_read_back()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off 4heat."""
@@ -87,6 +88,7 @@ class FourHeatSwitch(FourHeatAttributeEntity, SwitchEntity):
         await self.device.async_send_command(SERVICE_TURN_OFF)
         self.control_result = STATE_OFF
         self.async_write_ha_state()
+        self.coordinator.async_schedule_read_back()
 
     @callback
     def _update_callback(self) -> None:
@@ -0,0 +1,76 @@
+"""Event loop stall watchdog of 4heat devices."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from time import monotonic
+
+from .const import LOGGER, STALL_THRESHOLD, STALL_TICK
+from .stats import DeviceStatistics
+
+
+class StallWatchdog:
+    """Measure event loop lag while device commands run.
+
+    The device reports the phase of the running command (dns, connect, recv,
+    parse). While a command runs a ticker checks how late the loop wakes it
+    up, and stalls over STALL_THRESHOLD are counted against the phase the
+    command was in when the loop stopped answering.
+    """
+
+    def __init__(self, name: str, statistics: DeviceStatistics) -> None:
+        """Initialize the watchdog, disabled until enabled is set."""
+        self.name = name
+        self.enabled: bool = False
+        self._statistics = statistics
+        # recent phase changes (time, "command/phase"), None phase when idle
+        self._phases: deque[tuple[float, str | None]] = deque(maxlen=16)
+        self._task: asyncio.Task | None = None
+
+    def phase(self, command: str, phase: str) -> None:
+        """Mark the start of a command phase."""
+        if not self.enabled:
+            return
+        self._phases.append((monotonic(), f"{command}/{phase}"))
+        if self._task is None:
+            self._task = asyncio.create_task(self._async_watch())
+
+    def done(self) -> None:
+        """Mark the end of a command."""
+        if self._phases and self._phases[-1][1] is not None:
+            self._phases.append((monotonic(), None))
+
+    def cancel(self) -> None:
+        """Stop watching."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _phase_at(self, when: float) -> str:
+        """Return the command phase running at the given time."""
+        for started, phase in reversed(self._phases):
+            if started <= when:
+                return phase or "idle"
+        return "idle"
+
+    async def _async_watch(self) -> None:
+        """Tick while commands run and record the loop lag."""
+        try:
+            while self._phases and self._phases[-1][1] is not None:
+                expected = monotonic() + STALL_TICK
+                await asyncio.sleep(STALL_TICK)
+                lag = monotonic() - expected
+                self._statistics.loop_lag.record(lag)
+                if lag >= STALL_THRESHOLD:
+                    phase = self._phase_at(expected)
+                    self._statistics.stalls[phase] = (
+                        self._statistics.stalls.get(phase, 0) + 1
+                    )
+                    LOGGER.debug(
+                        "Event loop of %s stalled for %.0f ms during %s",
+                        self.name,
+                        lag * 1000,
+                        phase,
+                    )
+        finally:
+            self._task = None
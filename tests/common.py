@@ -0,0 +1,77 @@
+"""Helpers to run the 4heat integration against simulated stoves."""
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from homeassistant import config_entries
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import (
+    area_registry,
+    device_registry,
+    entity_registry,
+    restore_state,
+)
+from homeassistant.helpers.entity import DATA_ENTITY_SOURCE
+
+from benchmarks.simulator import FourHeatSimulator
+from custom_components.fourheat.connection import set_host_limits
+from custom_components.fourheat.const import DOMAIN
+
+# a small stove, every value has a name in the entity descriptions
+PARAMETERS = {
+    "30001": ("J", 0),  # State
+    "30002": ("J", 0),  # Error
+    "30003": ("J", 25),
+    "30004": ("J", 40),
+    "20180": ("B", 60),
+}
+
+
+@asynccontextmanager
+async def async_setup_stoves(
+    config_dir: Path, stoves: int
+) -> AsyncIterator[
+    tuple[HomeAssistant, list[FourHeatSimulator], list[config_entries.ConfigEntry]]
+]:
+    """Set up Home Assistant with a config entry per simulated stove."""
+    (config_dir / "custom_components").symlink_to(
+        Path(__file__).parents[1] / "custom_components"
+    )
+    hass = HomeAssistant()
+    hass.config.config_dir = str(config_dir)
+    hass.config.skip_pip = True
+    hass.data[DATA_ENTITY_SOURCE] = {}
+    await restore_state.async_load(hass)
+    await area_registry.async_load(hass)
+    await device_registry.async_load(hass)
+    await entity_registry.async_load(hass)
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await hass.config_entries.async_initialize()
+    await hass.async_start()
+
+    simulators = []
+    entries = []
+    for number in range(stoves):
+        simulator = FourHeatSimulator(dict(PARAMETERS))
+        await simulator.start()
+        # count the frames only, not the spacing of the host
+        set_host_limits(simulator.host, concurrency=1, spacing=0)
+        entry = config_entries.ConfigEntry(
+            1,
+            DOMAIN,
+            f"stove {number}",
+            {"host": simulator.host, "port": simulator.port, "mode": False},
+            "user",
+        )
+        await hass.config_entries.async_add(entry)
+        simulators.append(simulator)
+        entries.append(entry)
+    await hass.async_block_till_done()
+    try:
+        yield (hass, simulators, entries)
+    finally:
+        await hass.async_stop()
+        for simulator in simulators:
+            await simulator.stop()
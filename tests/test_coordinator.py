@@ -0,0 +1,55 @@
+"""Test the update intervals of the 4heat coordinator."""
+# pylint: disable=protected-access
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.fourheat import coordinator as coordinator_module
+from custom_components.fourheat.const import (
+    DEVICE_STATE_SENSOR,
+    DOMAIN,
+    UPDATE_INTERVAL_IDLE,
+    UPDATE_INTERVAL_STARTING,
+)
+from custom_components.fourheat.coordinator import get_entry_data
+
+from .common import async_setup_stoves
+
+READ_BACK_DELAY = 0.1  # Seconds until the written sensors are read back
+
+
+def test_turn_on_polls_fast(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Turning an idle stove on moves its next poll up to the starting pace."""
+    monkeypatch.setattr(coordinator_module, "READ_BACK_DELAY", READ_BACK_DELAY)
+
+    async def run() -> None:
+        async with async_setup_stoves(tmp_path, 1) as (hass, simulators, entries):
+            coordinator = get_entry_data(hass)[entries[0].entry_id].coordinator
+            assert coordinator
+            for _ in range(2):
+                await coordinator.async_refresh()
+            assert coordinator.update_interval == timedelta(
+                seconds=UPDATE_INTERVAL_IDLE
+            )
+
+            await hass.services.async_call(DOMAIN, "turn_on", {}, blocking=True)
+            await asyncio.sleep(2 * READ_BACK_DELAY)
+            await hass.async_block_till_done()
+            assert simulators[0].parameters[DEVICE_STATE_SENSOR][1] != 0
+            assert coordinator.device.sensors[DEVICE_STATE_SENSOR]["value"] != 0
+            assert coordinator.update_interval == timedelta(
+                seconds=UPDATE_INTERVAL_STARTING
+            )
+            assert coordinator._scheduled_poll is not None
+            assert (
+                coordinator._scheduled_poll - dt_util.utcnow().timestamp()
+                <= UPDATE_INTERVAL_STARTING
+            )
+
+    asyncio.run(run())
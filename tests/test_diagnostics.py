@@ -0,0 +1,35 @@
+"""Test the diagnostics of the 4heat integration."""
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from custom_components.fourheat.coordinator import get_entry_data
+from custom_components.fourheat.diagnostics import async_get_config_entry_diagnostics
+from custom_components.fourheat.exceptions import CommandError
+
+from .common import async_setup_stoves
+
+
+def test_diagnostics_redact_host(tmp_path: Path) -> None:
+    """Neither the entry nor connection errors in the trace show the host."""
+
+    async def run() -> None:
+        async with async_setup_stoves(tmp_path, 1) as (hass, simulators, entries):
+            coordinator = get_entry_data(hass)[entries[0].entry_id].coordinator
+            assert coordinator
+            await simulators[0].stop()
+            with pytest.raises(CommandError):
+                await coordinator.device.async_send_command("info", retry=False)
+
+            diagnostics = await async_get_config_entry_diagnostics(hass, entries[0])
+            assert diagnostics["device"]["last_error"]
+            assert [
+                entry for entry in diagnostics["trace"] if entry["direction"] == "error"
+            ]
+            assert simulators[0].host not in json.dumps(diagnostics, default=str)
+
+    asyncio.run(run())
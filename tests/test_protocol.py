@@ -0,0 +1,39 @@
+"""Test the 4heat wire protocol parser."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.fourheat.exceptions import InvalidMessage
+from custom_components.fourheat.protocol import FourHeatRecord, parse_frame
+
+
+def test_parse_records() -> None:
+    """Records are parsed, acknowledgements without value skipped."""
+    assert parse_frame(
+        b'["SEC","3","A20180", "B20180000000000070",\r\n"J30001000000000005"]'
+    ) == (
+        "SEC",
+        [FourHeatRecord("20180", "B", 70), FourHeatRecord("30001", "J", 5)],
+    )
+
+
+def test_parse_error_without_count() -> None:
+    """A bare error answer is an error result, not a malformed frame."""
+    assert parse_frame(b'["ERR"]') == ("ERR", [])
+    assert parse_frame(b'["ERR","0"]') == ("ERR", [])
+
+
+@pytest.mark.parametrize(
+    "frame",
+    [
+        b'["SEL","1","J3000x000000000005"]',
+        b'["SEL","1","J30001000000000O05"]',
+        b"['SEL','0']",
+        b'["SEL","0"',
+        b'["S\xe9L","0"]',
+    ],
+)
+def test_parse_malformed(frame: bytes) -> None:
+    """Malformed frames raise InvalidMessage."""
+    with pytest.raises(InvalidMessage):
+        parse_frame(frame)
@@ -0,0 +1,61 @@
+"""Test the TCP transactions of coordinator updates and the refresh service."""
+# pylint: disable=protected-access
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from homeassistant.helpers import entity_platform, entity_registry
+
+from custom_components.fourheat.const import DOMAIN
+from custom_components.fourheat.coordinator import get_entry_data
+
+from .common import async_setup_stoves
+
+
+def test_entities_are_push_only(tmp_path: Path) -> None:
+    """Entities don't ask for refreshes, an interval costs one transaction."""
+
+    async def run() -> None:
+        async with async_setup_stoves(tmp_path, 1) as (hass, simulators, entries):
+            entities = [
+                entity
+                for platform in entity_platform.async_get_platforms(hass, DOMAIN)
+                for entity in platform.entities.values()
+            ]
+            assert len(entities) > 1
+            assert not [entity for entity in entities if entity.should_poll]
+
+            coordinator = get_entry_data(hass)[entries[0].entry_id].coordinator
+            assert coordinator
+            frames = simulators[0].frames
+            # a full SEL sweep, the most a single update interval reads
+            coordinator._last_discovery = None
+            await coordinator.async_refresh()
+            await hass.async_block_till_done()
+            assert simulators[0].frames - frames == 1
+
+    asyncio.run(run())
+
+
+def test_refresh_service_targets_stove(tmp_path: Path) -> None:
+    """The refresh service reads the stoves of the targeted entities only."""
+
+    async def run() -> None:
+        async with async_setup_stoves(tmp_path, 2) as (hass, simulators, entries):
+            ent_reg = entity_registry.async_get(hass)
+            for target in (1, 0):
+                entity_id = entity_registry.async_entries_for_config_entry(
+                    ent_reg, entries[target].entry_id
+                )[0].entity_id
+                frames = [simulator.frames for simulator in simulators]
+                await hass.services.async_call(
+                    DOMAIN, "refresh", {"entity_id": entity_id}, blocking=True
+                )
+                await hass.async_block_till_done()
+                assert [
+                    simulator.frames - before
+                    for simulator, before in zip(simulators, frames)
+                ] == [int(number == target) for number in range(2)]
+
+    asyncio.run(run())
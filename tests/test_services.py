@@ -0,0 +1,50 @@
+"""Test the value services of the 4heat integration."""
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from homeassistant.helpers import entity_registry
+
+from custom_components.fourheat.const import DOMAIN
+
+from .common import async_setup_stoves
+
+PARAMETER = "20180"
+
+
+def test_set_values(tmp_path: Path) -> None:
+    """Values are set to numbers and entity states, typos are rejected."""
+
+    async def run() -> None:
+        async with async_setup_stoves(tmp_path, 1) as (hass, simulators, entries):
+            ent_reg = entity_registry.async_get(hass)
+            entity_id = next(
+                entry.entity_id
+                for entry in entity_registry.async_entries_for_config_entry(
+                    ent_reg, entries[0].entry_id
+                )
+                if entry.domain == "number" and entry.unique_id.endswith(PARAMETER)
+            )
+            parameters = simulators[0].parameters
+
+            async def set_values(value: object) -> None:
+                await hass.services.async_call(
+                    DOMAIN, "set_values", {"values": {entity_id: value}}, blocking=True
+                )
+
+            await set_values(0)
+            assert parameters[PARAMETER][1] == 0
+            await set_values("55")
+            assert parameters[PARAMETER][1] == 55
+            hass.states.async_set("input_number.profile", "48.0")
+            await set_values("input_number.profile")
+            assert parameters[PARAMETER][1] == 48
+
+            frames = simulators[0].frames
+            for typo in ("5o", "input_number.missing", None):
+                await set_values(typo)
+            assert simulators[0].frames == frames
+            assert parameters[PARAMETER][1] == 48
+
+    asyncio.run(run())
@@ -0,0 +1,61 @@
+"""Test that device communication doesn't block the event loop."""
+from __future__ import annotations
+
+import asyncio
+from statistics import quantiles
+import time
+
+import pytest
+
+from benchmarks.simulator import FourHeatSimulator
+from custom_components.fourheat import fourheat
+from custom_components.fourheat.connection import set_host_limits
+from custom_components.fourheat.exceptions import CommandError
+from custom_components.fourheat.fourheat import FourHeatDevice
+
+SOCKET_TIMEOUT = 0.5  # Seconds to wait for the silent stove
+TICK = 0.001  # Seconds between event loop lag probes
+MAX_LAG = 0.005  # Seconds the loop may be late (p99) while waiting for the stove
+
+
+def test_unresponsive_device_does_not_block_loop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The event loop keeps running while a stove accepts but never answers."""
+    monkeypatch.setattr(fourheat, "SOCKET_TIMEOUT", SOCKET_TIMEOUT)
+
+    async def run() -> None:
+        # answers after a minute, far beyond the socket timeout
+        simulator = FourHeatSimulator(latency=60)
+        await simulator.start()
+        set_host_limits(simulator.host, concurrency=1, spacing=0)
+        device = await FourHeatDevice.create(
+            "silent", simulator.host, simulator.port, initialize=False
+        )
+        lags: list[float] = []
+
+        async def probe() -> None:
+            while True:
+                expected = time.perf_counter() + TICK
+                await asyncio.sleep(TICK)
+                lags.append(time.perf_counter() - expected)
+
+        prober = asyncio.create_task(probe())
+        started = time.perf_counter()
+        try:
+            with pytest.raises(CommandError):
+                await device.async_send_command("init", retry=False)
+        finally:
+            prober.cancel()
+            await device.async_shutdown()
+            await simulator.stop()
+
+        assert simulator.frames == 1
+        assert time.perf_counter() - started >= SOCKET_TIMEOUT
+        # the loop kept ticking for the whole wait
+        assert len(lags) > SOCKET_TIMEOUT / TICK / 2
+        assert quantiles(lags, n=100)[98] < MAX_LAG
+        # single late ticks are the host scheduler, a blocking call takes the timeout
+        assert max(lags) < SOCKET_TIMEOUT / 10
+
+    asyncio.run(run())
@@ -0,0 +1,101 @@
+"""Test the command worker of FourHeatDevice."""
+# pylint: disable=protected-access
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+import pytest
+
+from benchmarks.simulator import FourHeatSimulator
+from custom_components.fourheat import fourheat
+from custom_components.fourheat.connection import set_host_limits
+from custom_components.fourheat.exceptions import NotInitialized
+from custom_components.fourheat.fourheat import FourHeatDevice
+
+PARAMETERS = {"30001": ("J", 0), "30002": ("J", 0), "30003": ("J", 25)}
+
+
+def run_with_device(
+    test: Callable[[FourHeatDevice, FourHeatSimulator], Awaitable[None]],
+    latency: float = 0,
+) -> None:
+    """Run a test with an initialized device of a simulated stove."""
+
+    async def run() -> None:
+        simulator = FourHeatSimulator(dict(PARAMETERS))
+        await simulator.start()
+        set_host_limits(simulator.host, concurrency=1, spacing=0)
+        device = await FourHeatDevice.create("worker", simulator.host, simulator.port)
+        simulator.latency = latency
+        try:
+            await asyncio.wait_for(test(device, simulator), 10)
+        finally:
+            await device.async_shutdown()
+            await simulator.stop()
+
+    asyncio.run(run())
+
+
+class RacingQueue(asyncio.PriorityQueue):
+    """Queue getting an item while the idle worker cancels get()."""
+
+    item: tuple | None = None
+
+    async def get(self):  # type: ignore[no-untyped-def]
+        """Get an item, put the racing item when cancelled."""
+        try:
+            return await super().get()
+        except asyncio.CancelledError:
+            if self.item is not None:
+                self.put_nowait(self.item)
+                self.item = None
+            raise
+
+
+def test_idle_worker_serves_query_queued_while_stopping(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A query queued during the idle timeout is still sent."""
+    monkeypatch.setattr(fourheat, "COMMAND_WORKER_IDLE", 0.1)
+
+    async def test(device: FourHeatDevice, simulator: FourHeatSimulator) -> None:
+        queue = device._command_queue = RacingQueue()
+        future = asyncio.get_running_loop().create_future()
+        queue.item = (0, -1, "info", device.commands["info"], future)
+        await device.async_send_command("info")
+        (result, sensors) = await future
+        assert len(sensors) == len(PARAMETERS)
+        assert queue.empty()
+
+    run_with_device(test)
+
+
+def test_cancelled_caller_keeps_worker_running() -> None:
+    """A caller cancelled during the exchange doesn't stop the worker."""
+
+    async def test(device: FourHeatDevice, simulator: FourHeatSimulator) -> None:
+        caller = asyncio.create_task(device.async_send_command("info"))
+        await asyncio.sleep(0.1)
+        caller.cancel()
+        assert len(await device.async_send_command("info") or []) == len(PARAMETERS)
+        assert device._command_worker is not None
+        assert not device._command_worker.done()
+
+    run_with_device(test, latency=0.2)
+
+
+def test_shutdown_fails_running_and_queued_commands() -> None:
+    """Shutdown fails the command on the wire and the queued ones."""
+
+    async def test(device: FourHeatDevice, simulator: FourHeatSimulator) -> None:
+        callers = [
+            asyncio.create_task(device.async_send_command("info")) for _ in range(2)
+        ]
+        await asyncio.sleep(0.1)
+        await device.async_shutdown()
+        for caller in callers:
+            with pytest.raises(NotInitialized):
+                await caller
+
+    run_with_device(test, latency=5)